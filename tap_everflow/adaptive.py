@@ -0,0 +1,52 @@
+"""Adaptive request sizing for tap-everflow."""
+
+from __future__ import annotations
+
+import threading
+
+
+class AdaptiveSize:
+    """Request size tuned between requests from observed responses.
+
+    The size is halved when a response is slow, too large or fails, and doubled when
+    a response is fast, always staying within `minimum` and `maximum`.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        *,
+        minimum: float,
+        maximum: float,
+        target_seconds: float,
+        max_bytes: int,
+    ) -> None:
+        """Create an adaptive size starting at `initial`."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+        self._value = min(max(initial, minimum), maximum)
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> float:
+        """Current size."""
+        return self._value
+
+    def observe(self, elapsed: float, size: int) -> None:
+        """Adjust the size from the response time and body size of a request."""
+        if elapsed > self.target_seconds or size > self.max_bytes:
+            self.shrink()
+        elif elapsed < self.target_seconds / 2 and size < self.max_bytes / 2:
+            self.grow()
+
+    def shrink(self) -> None:
+        """Halve the size, e.g. after a server error or timeout."""
+        with self._lock:
+            self._value = max(self._value / 2, self.minimum)
+
+    def grow(self) -> None:
+        """Double the size."""
+        with self._lock:
+            self._value = min(self._value * 2, self.maximum)
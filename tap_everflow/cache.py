@@ -0,0 +1,84 @@
+"""Reference data cache for tap-everflow."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache:
+    """Rarely-changing reference data, shared by all streams of a tap.
+
+    Values are kept in memory and, if `path` is set, in a JSON file reused by later
+    runs. Entries older than `ttl` seconds are fetched again.
+    """
+
+    def __init__(self, path: str | Path | None = None, ttl: float = 86400) -> None:
+        """Create a cache, persisted to `path` if set."""
+        self.path = Path(path).expanduser() if path else None
+        self.ttl = ttl
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Get the value for `key`, calling `fetch` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key) or self._load().get(key)
+
+            if entry is None or time.time() - entry["fetched_at"] > self.ttl:
+                entry = {"fetched_at": time.time(), "value": fetch()}
+                self._entries[key] = entry
+                self._save()
+
+            self._entries[key] = entry
+            return entry["value"]
+
+    def invalidate(self, key: str) -> None:
+        """Remove the value for `key`, so it is fetched again on next use."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._save(remove=key)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if not self.path:
+            return {}
+
+        try:
+            with self.path.open() as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable metadata cache %s", self.path)
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self, remove: str | None = None) -> None:
+        if not self.path:
+            return
+
+        # keep entries written by other runs since this one loaded the file
+        entries = {**self._load(), **self._entries}
+
+        if remove:
+            entries.pop(remove, None)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+
+            Path(tmp_path).replace(self.path)
+        except OSError:
+            logger.warning("Could not write metadata cache %s", self.path)
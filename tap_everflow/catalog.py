@@ -0,0 +1,55 @@
+"""Discovery catalog shipped with tap-everflow.
+
+Regenerate it after changing a stream schema or the tap version with:
+
+    python -m tap_everflow.catalog
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from singer_sdk import Tap
+
+#: Catalog of every stream, generated for the tap version it holds.
+CATALOG_PATH: Path = Path(__file__).with_name("catalog.json")
+
+
+def load(path: Path, version: str) -> dict | None:
+    """Load the catalog at `path`, if it was generated for tap `version`."""
+    try:
+        catalog: dict = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+
+    if catalog.pop("version", None) != version:
+        return None
+
+    return catalog
+
+
+def generate(tap_class: type[Tap]) -> dict:
+    """Generate the catalog of `tap_class`, building every stream schema."""
+    tap = tap_class(
+        config={"api_key": ""},
+        parse_env_config=False,
+        validate_config=False,
+        setup_mapper=False,
+    )
+    tap.catalog_path = None  # type: ignore[attr-defined]
+
+    return {"version": tap.plugin_version, **json.loads(tap.catalog_json_text)}
+
+
+def write(tap_class: type[Tap], path: Path = CATALOG_PATH) -> None:
+    """Write the catalog of `tap_class` to `path`."""
+    path.write_text(json.dumps(generate(tap_class), indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    from tap_everflow.tap import TapEverflow
+
+    write(TapEverflow)
@@ -2,14 +2,90 @@
 
 from __future__ import annotations
 
-from datetime import timezone
+import abc
+import copy
+import json
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
 from functools import cached_property
+from http import HTTPStatus
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from urllib.parse import parse_qsl, urlsplit
+from weakref import WeakKeyDictionary
 
+import requests
+import singer_sdk.singerlib as singer
+from requests.adapters import HTTPAdapter
+from singer_sdk import metrics
 from singer_sdk.authenticators import APIKeyAuthenticator
+from singer_sdk.batch import Batcher
+from singer_sdk.exceptions import RetriableAPIError
+from singer_sdk.helpers._typing import _warn_unmapped_properties
+from singer_sdk.helpers._util import utc_now
+from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.streams import RESTStream
-from typing_extensions import override
+from typing_extensions import Self, override
+from urllib3.util import make_headers
 
+from tap_everflow import jsonstream, serialization
+from tap_everflow.adaptive import AdaptiveSize
+from tap_everflow.dedupe import SeenIndex
 from tap_everflow.pagination import EverflowPaginator
+from tap_everflow.profiling import StackSampler
+from tap_everflow.ratelimit import get_retry_after
+from tap_everflow.telemetry import Metric
+from tap_everflow.transform import compile_pruner, compile_transformer
+
+if TYPE_CHECKING:
+    import threading
+    from collections.abc import Awaitable, Iterable, Iterator, Mapping
+    from concurrent.futures import Future
+
+    from tap_everflow.cache import MetadataCache
+    from tap_everflow.engine import AsyncEngine
+    from tap_everflow.ratelimit import RateLimiter
+    from tap_everflow.tap import TapEverflow
+    from tap_everflow.telemetry import Telemetry
+    from tap_everflow.transform import Converter
+
+    _AsyncRequest = Callable[
+        [requests.PreparedRequest, Any], Awaitable[requests.Response]
+    ]
+
+_T = TypeVar("_T")
+
+
+def build_session(config: Mapping[str, Any]) -> requests.Session:
+    """Build an HTTP session to share between all streams of a tap.
+
+    The connection pool is sized for the configured request concurrency across
+    streams and accounts synced in parallel, so connections are kept alive and
+    reused rather than discarded, and responses are requested with every
+    compression the installed urllib3 can decode.
+    """
+    accounts = len(config.get("accounts", [])) or 1
+    pool_size = (
+        max(config.get("max_concurrency", 1), 1)
+        * max(config.get("max_parallel_streams", 1), 1)
+        * min(max(config.get("max_parallel_accounts") or accounts, 1), accounts)
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+        "accept-encoding"
+    ]
+    session.stream = bool(config.get("stream_responses"))
+
+    return session
 
 
 class EverflowStream(RESTStream):
@@ -17,19 +93,221 @@ class EverflowStream(RESTStream):
 
     url_base = "https://api.eflow.team/v1"
 
+    #: Size of the chunks read from the socket when streaming responses.
+    stream_chunk_size = 64 * 1024
+
+    #: Response body size above which adaptive request sizes are reduced.
+    adaptive_max_bytes = 64 * 1024 * 1024
+
+    #: Cached properties tuned or tracked while syncing, not shared between accounts.
+    account_properties: tuple[str, ...] = ("authenticator", "page_size", "seen_index")
+
+    #: Account synced by this copy of the stream, if syncing several.
+    account: dict | None = None
+
+    _tap: TapEverflow
+
+    @override
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._init_sync_state()
+
+        if self.config.get("accounts"):
+            self.primary_keys = ("network_id", *self.primary_keys)
+
+    def _init_sync_state(self) -> None:
+        self._parsed_responses: WeakKeyDictionary[requests.Response, Any] = (
+            WeakKeyDictionary()
+        )
+        self._request_payloads: WeakKeyDictionary[requests.PreparedRequest, Any] = (
+            WeakKeyDictionary()
+        )
+
+        self._page_size = int(self.page_size.value)
+        self._output_seconds = 0.0
+
+    def for_account(self, account: dict) -> Self:
+        """Copy the stream to sync one of the configured `accounts`.
+
+        The copy shares the schema, catalog, stream maps and tap resources such as
+        the HTTP session, but sends its own API key and keeps its own state.
+        """
+        stream = copy.copy(self)
+        stream.account = account
+
+        for name in self.account_properties:
+            stream.__dict__.pop(name, None)
+
+        stream._init_sync_state()  # noqa: SLF001
+        return stream
+
+    @property
+    def api_key(self) -> str:
+        """Everflow API key requests are sent with."""
+        return (self.account or self.config).get("api_key", "")
+
+    @property
+    def start_date(self) -> str:
+        """The earliest record date to sync, for the account if it has its own."""
+        return (self.account or {}).get("start_date") or self.config["start_date"]
+
+    @override
+    @property
+    def partitions(self):
+        if self.account:
+            return [{"network_id": self.account["network_id"]}]
+
+        if accounts := self.config.get("accounts"):
+            return [{"network_id": account["network_id"]} for account in accounts]
+
+        return super().partitions
+
+    @override
+    @property
+    def requests_session(self):
+        return self._tap.requests_session
+
     @override
     @cached_property
     def authenticator(self):
         return APIKeyAuthenticator.create_for_stream(
             self,
             key="X-Eflow-API-Key",
-            value=self.config.get("api_key", ""),
+            value=self.api_key,
             location="header",
         )
 
     @override
     def get_new_paginator(self):
-        return EverflowPaginator()
+        return EverflowPaginator(self)
+
+    @override
+    @cached_property
+    def schema(self):
+        # read from the shipped catalog if current, as building schemas is slow
+        if catalog := self._tap.shipped_catalog:
+            for entry in catalog["streams"]:
+                if entry["tap_stream_id"] == self.name:
+                    return entry["schema"]
+
+        return self.build_schema()
+
+    @abc.abstractmethod
+    def build_schema(self) -> dict:
+        """Build the JSON schema of the stream from its definition."""
+
+    @property
+    def metadata_cache(self) -> MetadataCache:
+        """Reference data cache shared by all streams."""
+        return self._tap.metadata_cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Rate limiter shared by all streams for the API key."""
+        return self._tap.rate_limiters[self.api_key]
+
+    @property
+    def telemetry(self) -> Telemetry:
+        """Summary of the metrics logged by all streams."""
+        return self._tap.telemetry
+
+    def log_metric(self, metric: Metric, value: float, **tags) -> None:
+        """Log a measurement of this stream as a METRIC line."""
+        self._log_metric(
+            metrics.Point(
+                metric.metric_type,
+                metric,  # type: ignore[arg-type]
+                value,
+                {
+                    metrics.Tag.STREAM: self.name,
+                    metrics.Tag.ENDPOINT: self.path,
+                    **tags,
+                },
+            )
+        )
+
+    @override
+    def _log_metric(self, point):
+        super()._log_metric(point)
+        self.telemetry.observe(point)
+
+    @property
+    def state_lock(self) -> threading.RLock:
+        """Lock held while reading or writing tap state."""
+        return self._tap.message_writer.lock
+
+    @override
+    def get_context_state(self, context):
+        with self.state_lock:
+            return super().get_context_state(context)
+
+    @override
+    def _write_starting_replication_value(self, context):
+        with self.state_lock:
+            super()._write_starting_replication_value(context)
+
+    @override
+    def _increment_stream_state(self, latest_record, *, context=None):
+        with self.state_lock:
+            super()._increment_stream_state(latest_record, context=context)
+
+    @override
+    def _write_state_message(self):
+        with self.state_lock:
+            super()._write_state_message()
+
+    @override
+    def _finalize_state(self, state=None):
+        with self.state_lock:
+            super()._finalize_state(state)
+
+    @override
+    def finalize_state_progress_markers(self, state=None):
+        with self.state_lock:
+            super().finalize_state_progress_markers(state)
+
+    @property
+    def engine(self) -> AsyncEngine | None:
+        """Async request engine shared by all streams, if enabled."""
+        return self._tap.request_engine
+
+    def async_request_decorator(self, func: _AsyncRequest) -> _AsyncRequest:
+        """Retry a coroutine function sending requests, as `request_decorator` does.
+
+        The backoff decorators the SDK applies also support coroutine functions.
+        """
+        return self.request_decorator(func)  # type: ignore[arg-type,return-value]
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of requests to have in flight at once."""
+        return max(self.config.get("max_concurrency", 1), 1)
+
+    @cached_property
+    def page_size(self) -> AdaptiveSize:
+        """Number of records requested per page."""
+        return self._get_adaptive_size(
+            2000,
+            minimum=self.config.get("min_page_size", 100),
+            maximum=self.config.get("max_page_size", 2000),
+        )
+
+    @property
+    def adaptive_size(self) -> AdaptiveSize:
+        """Request size tuned from observed responses."""
+        return self.page_size
+
+    def _get_adaptive_size(self, initial, *, minimum, maximum) -> AdaptiveSize:
+        if not self.config.get("adaptive_sizing"):
+            minimum = maximum = initial
+
+        return AdaptiveSize(
+            initial,
+            minimum=minimum,
+            maximum=maximum,
+            target_seconds=self.config.get("adaptive_target_seconds", 30),
+            max_bytes=self.adaptive_max_bytes,
+        )
 
     @override
     def get_url_params(self, context, next_page_token):
@@ -37,21 +315,544 @@ class EverflowStream(RESTStream):
 
         if next_page_token:
             params["page"] = next_page_token
+        else:
+            # page offsets depend on the page size, so only change it between runs
+            self._page_size = int(self.page_size.value)
 
-        params["page_size"] = 2000
+        params["page_size"] = self._page_size
 
         return params
 
+    @override
+    def validate_response(self, response):
+        self.rate_limiter.observe(response)
+
+        try:
+            super().validate_response(response)
+        except RetriableAPIError:
+            # rate limited responses are paced by the rate limiter instead
+            if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                self.adaptive_size.shrink()
+
+            raise
+
+        size = (
+            int(response.headers.get("Content-Length", 0))
+            if self.requests_session.stream
+            else len(response.content)
+        )
+        self.adaptive_size.observe(response.elapsed.total_seconds(), size)
+        self.log_metric(Metric.HTTP_RESPONSE_BYTES, size)
+
+    @override
+    def backoff_wait_generator(self):
+        expo = super().backoff_wait_generator()
+        next(expo)
+        exception = yield
+
+        while True:
+            # wait as long as the API asked, which pauses every other request too
+            rate_limited = (
+                isinstance(exception, RetriableAPIError)
+                and exception.response is not None
+                and get_retry_after(exception.response) is not None
+            )
+            exception = yield (
+                self.rate_limiter.remaining_pause if rate_limited else next(expo)
+            )
+
+    @override
+    def backoff_handler(self, details):
+        super().backoff_handler(details)
+        self.log_metric(Metric.HTTP_RETRY_COUNT, 1)
+
+        if isinstance(details.get("exception"), requests.exceptions.Timeout):
+            self.adaptive_size.shrink()
+
+    @override
+    def build_prepared_request(self, *args, **kwargs):
+        prepared_request = super().build_prepared_request(*args, **kwargs)
+        self._request_payloads[prepared_request] = kwargs.get("json")
+
+        return prepared_request
+
+    @cached_property
+    def record_transformer(self) -> Converter:
+        """Prune and conform records to the stream schema in one pass."""
+        return compile_transformer(
+            self.effective_schema,
+            mask=self.mask,
+            level=self.TYPE_CONFORMANCE_LEVEL,
+        )
+
+    @cached_property
+    def record_pruner(self) -> Callable[[dict], dict] | None:
+        """Remove deselected properties from parsed records, if there are any."""
+        return compile_pruner(self.schema, self.mask)
+
+    @cached_property
+    def seen_index(self) -> SeenIndex | None:
+        """Keys of records emitted recently, if duplicates are to be dropped."""
+        max_size: int = self.config.get("dedupe_index_size", 100_000)
+
+        if not max_size or not self.primary_keys:
+            return None
+
+        return SeenIndex(max_size)
+
+    @override
+    def get_records(self, context):
+        records = super().get_records(context)
+
+        if self.seen_index is None:
+            yield from records
+            return
+
+        dropped = self.seen_index.dropped
+
+        # records at page and window boundaries can be requested more than once
+        for record in records:
+            if self.seen_index.add(tuple(record.get(k) for k in self.primary_keys)):
+                yield record
+
+        if self.seen_index.dropped > dropped:
+            self.logger.info(
+                "Dropped %d duplicate records (%d in total)",
+                self.seen_index.dropped - dropped,
+                self.seen_index.dropped,
+            )
+
+    def transform_record(self, record: dict) -> dict:
+        """Prune and conform a record to the stream schema."""
+        unmapped: list[str] = []
+        record = self.record_transformer(record, unmapped)
+
+        if unmapped:
+            _warn_unmapped_properties(self.name, tuple(unmapped), self.logger)
+
+        return record
+
+    @override
+    def post_process(self, row, context=None):
+        if self.account:
+            row["network_id"] = self.account["network_id"]
+
+        return row
+
+    # final in the SDK, which has no hook around a whole sync to profile it, or to
+    # sync several accounts at once as one stream
+    @override  # type: ignore[misc]
+    def sync(self, context=None):
+        profile_dir: str | None = self.config.get("profile_dir")
+        sampler = StackSampler(self.name) if profile_dir else None
+        started = datetime.now(tz=timezone.utc)
+
+        try:
+            with sampler or nullcontext():
+                if self.config.get("accounts") and not self.account and not context:
+                    self._sync_accounts()
+                else:
+                    self._sync(context)
+        finally:
+            if sampler:
+                path = (
+                    Path(profile_dir)
+                    / f"{self.name}-{started:%Y%m%dT%H%M%SZ}.collapsed"
+                )
+                sampler.write(path)
+                self.logger.info(
+                    "Wrote %d profile samples to %s",
+                    sum(sampler.samples.values()),
+                    path,
+                )
+
+    def _sync(self, context) -> None:
+        super().sync(context)
+
+    @override
+    def _sync_records(self, context=None, *, write_messages=True):
+        self._output_seconds = 0.0
+
+        try:
+            yield from super()._sync_records(context, write_messages=write_messages)
+        finally:
+            self.log_metric(Metric.OUTPUT_BLOCKED_DURATION, self._output_seconds)
+
+    def _sync_accounts(self) -> None:
+        accounts: list[dict] = self.config["accounts"]
+        max_workers = self.config.get("max_parallel_accounts") or len(accounts)
+
+        # named after the stream, so worker threads are profiled along with it
+        executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix=f"{self.name}_account"
+        )
+
+        try:
+            for future in as_completed(
+                executor.submit(self.for_account(account)._sync, None)  # noqa: SLF001
+                for account in accounts
+            ):
+                future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @override
+    def _write_record_message(self, record):
+        for record_message in self._generate_record_messages(record):
+            # time spent waiting on the writer lock and stdout
+            start = time.perf_counter()
+            self._tap.write_message(record_message)
+            self._output_seconds += time.perf_counter() - start
+
+        self._is_state_flushed = False
+
+    @override
+    def _generate_record_messages(self, record):
+        record = self.transform_record(record)
+
+        for stream_map in self.stream_maps:
+            mapped_record = stream_map.transform(record)
+
+            if mapped_record is not None:
+                yield singer.RecordMessage(
+                    stream=stream_map.stream_alias,
+                    record=mapped_record,
+                    version=self._stream_version,
+                    time_extracted=utc_now(),
+                )
+
+    @override
+    def get_batches(self, batch_config, context=None):
+        batcher = Batcher(
+            tap_name=self.tap_name,
+            stream_name=self.name,
+            batch_config=batch_config,
+        )
+
+        # batch each partition separately, so the state checkpointed after a batch
+        # never covers records still waiting to be written to a file
+        for partition in [context] if context else self.partitions or [None]:
+            records = map(
+                self.transform_record,
+                self._sync_records(partition, write_messages=False),
+            )
+
+            for manifest in batcher.get_batches(records=records):
+                yield batch_config.encoding, manifest
+
+    @override
+    def _request(self, prepared_request, context):
+        if self.engine:
+            return self.engine.run(self._request_async(prepared_request, context))
+
+        self._resize_page(prepared_request)
+        self.rate_limiter.acquire()
+        return super()._request(prepared_request, context)
+
+    def _resize_page(self, prepared_request: requests.PreparedRequest) -> None:
+        """Request a page at the current page size, if it shrank since it was built.
+
+        Pages are numbered by size, so a page retried at a fraction of its size is
+        mapped to the first smaller page covering the same records. Pages requested
+        concurrently keep the size their numbers were worked out for.
+        """
+        if self.max_concurrency > 1:
+            return
+
+        url = urlsplit(str(prepared_request.url))
+        params = dict(parse_qsl(url.query))
+
+        if "page_size" not in params:
+            return
+
+        page_size = int(params["page_size"])
+        new_page_size = int(self.page_size.value)
+
+        if new_page_size >= page_size or page_size % new_page_size:
+            return
+
+        page = int(params.get("page", 1))
+        params["page"] = str((page - 1) * page_size // new_page_size + 1)
+        params["page_size"] = str(new_page_size)
+        prepared_request.prepare_url(url._replace(query="").geturl(), params)
+        self._page_size = new_page_size
+
+        self.logger.info(
+            "Requesting page %d of %d records as page %s of %d records",
+            page,
+            page_size,
+            params["page"],
+            new_page_size,
+        )
+
+    async def _request_async(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context,
+    ) -> requests.Response:
+        if not self.engine:
+            msg = "The async request engine is not enabled"
+            raise RuntimeError(msg)
+
+        self._resize_page(prepared_request)
+        await self.rate_limiter.acquire_async()
+        response = await self.engine.send(prepared_request, timeout=self.timeout)
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": prepared_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        self.validate_response(response)
+        return response
+
+    @override
+    def request_records(self, context):
+        paginator = self.get_new_paginator()
+
+        if self.max_concurrency > 1 and isinstance(paginator, EverflowPaginator):
+            yield from self._request_pages_concurrently(context, paginator)
+            return
+
+        yield from super().request_records(context)
+
+    def _request_pages_concurrently(self, context, paginator: EverflowPaginator):
+        fetch: Callable[[int | None], Any]
+
+        if self.engine:
+            decorated_request_async = self.async_request_decorator(self._request_async)
+
+            async def fetch_async(page: int | None):
+                prepared_request = self.prepare_request(context, next_page_token=page)
+                response = await decorated_request_async(prepared_request, context)
+                return prepared_request, response
+
+            fetch = fetch_async
+        else:
+            decorated_request = self.request_decorator(self._request)
+
+            def fetch_sync(page: int | None):
+                prepared_request = self.prepare_request(context, next_page_token=page)
+                response = decorated_request(prepared_request, context)
+
+                if not self.config.get("stream_responses"):
+                    self.parse_json(response)  # decode off the main thread
+
+                return prepared_request, response
+
+            fetch = fetch_sync
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            [(prepared_request, response)] = self.map_concurrently(
+                fetch, [paginator.current_value]
+            )
+            request_counter.increment()
+            self.update_sync_costs(prepared_request, response, context)
+
+            yield from self.parse_response(response)
+            paginator.advance(response)
+
+            if paginator.finished:
+                return
+
+            # every remaining page is known from the first response, so request them
+            # ahead while records are emitted in page order
+            pages = range(paginator.current_value, paginator.get_last(response) + 1)
+
+            for prepared_request, response in self.map_concurrently(fetch, pages):
+                request_counter.increment()
+                self.update_sync_costs(prepared_request, response, context)
+
+                yield from self.parse_response(response)
+
+    @contextmanager
+    def submitter(self, func: Callable[[_T], Any]) -> Iterator[Callable[[_T], Future]]:
+        """Get a function that calls `func` in the background, returning a future.
+
+        Calls run over a thread pool of `max_concurrency` threads, or as coroutines
+        on the async engine if enabled, in which case `func` must be a coroutine
+        function.
+        """
+        if engine := self.engine:
+            yield lambda item: engine.submit(func(item))
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix=self.name,
+        ) as pool:
+            yield lambda item: pool.submit(func, item)
+
+    def map_concurrently(
+        self, func: Callable[[_T], Any], items: Iterable[_T]
+    ) -> Iterator[Any]:
+        """Apply `func` to `items` concurrently, yielding results in order.
+
+        At most `max_concurrency` calls are in flight at once, submitted as by
+        `submitter`.
+        """
+        items = iter(items)
+
+        with self.submitter(func) as submit:
+            pending = deque(
+                submit(item) for item in islice(items, self.max_concurrency)
+            )
+
+            try:
+                while pending:
+                    result = pending.popleft().result()
+
+                    for item in islice(items, 1):
+                        pending.append(submit(item))
+
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @override
+    def parse_response(self, response):
+        if self.config.get("stream_responses"):
+            records = self._stream_response(response)
+        else:
+            records = extract_jsonpath(
+                self.records_jsonpath,
+                input=self.parse_json(response),
+            )
+
+        # drop deselected properties as soon as records are parsed, so they are not
+        # held in memory or processed any further
+        if self.record_pruner:
+            records = map(self.record_pruner, records)
+
+        count = 0
+
+        for record in records:
+            count += 1
+            yield record
+
+        self.log_metric(Metric.PAGE_RECORD_COUNT, count)
+
+    def parse_json(self, response: requests.Response) -> Any:  # noqa: ANN401
+        """Decode a response body once, shared by pagination and record parsing.
+
+        Responses parsed with `stream_responses` enabled resolve to the top-level
+        object read alongside the records, with the records array truncated to its
+        first item.
+        """
+        try:
+            return self._parsed_responses[response]
+        except KeyError:
+            content = response.content
+            start = time.perf_counter()
+            data = self._parsed_responses[response] = serialization.loads(content)
+            self.log_metric(Metric.DECODE_DURATION, time.perf_counter() - start)
+            return data
+
+    def _get_start_date(self, context) -> datetime:
+        start_value = self.get_starting_replication_key_value(context)
+
+        if isinstance(start_value, int):  # from state
+            return datetime.fromtimestamp(start_value, tz=timezone.utc)
+
+        # from config, or the account
+        return datetime.fromisoformat(self.start_date).astimezone(timezone.utc)
+
+    def _stream_response(self, response: requests.Response):
+        match = re.fullmatch(r"\$\.(\w+)\[\*\]", self.records_jsonpath)
+
+        if not match:
+            msg = f"Cannot stream records for JSONPath {self.records_jsonpath}"
+            raise ValueError(msg)
+
+        envelope: dict[str, Any] = {}
+        body = response
+        streamed = 0
+        max_tries = self.backoff_max_tries()
+
+        for attempt in range(1, max_tries + 1):
+            records = jsonstream.iter_records(
+                body.iter_content(self.stream_chunk_size),
+                match.group(1),
+                envelope,
+            )
+
+            try:
+                # skip records already yielded before the body was interrupted
+                for record in islice(records, streamed, None):
+                    streamed += 1
+                    yield record
+            except (requests.exceptions.ChunkedEncodingError, requests.ConnectionError):
+                if attempt == max_tries:
+                    raise
+
+                self.logger.warning(
+                    "Response body interrupted after %d records, requesting it again",
+                    streamed,
+                )
+                self.log_metric(Metric.HTTP_RETRY_COUNT, 1)
+                body = self.request_decorator(self._request)(response.request, None)
+            else:
+                break
+
+        self._parsed_responses[response] = envelope
+
+    def request_payload(self, request: requests.PreparedRequest) -> Any:  # noqa: ANN401
+        """Get the payload a request was built from, without decoding its body."""
+        try:
+            return self._request_payloads[request]
+        except KeyError:
+            return json.loads(request.body) if request.body else None
+
+    def get_metadata(self, path: str, *, refresh: bool = False) -> Any:  # noqa: ANN401
+        """Get a reference endpoint response, cached between streams and runs."""
+        url = f"{self.url_base}{path}"
+
+        if refresh:
+            self.metadata_cache.invalidate(url)
+
+        return self.metadata_cache.get(url, lambda: self._fetch_metadata(url))
+
+    def _fetch_metadata(self, url: str) -> Any:  # noqa: ANN401
+        prepared_request = self.build_prepared_request(
+            method="GET",
+            url=url,
+            headers=self.http_headers,
+        )
+        decorated_request = self.request_decorator(self._request_metadata)
+
+        return decorated_request(prepared_request, None).json()
+
+    def _request_metadata(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context,  # noqa: ARG002
+    ) -> requests.Response:
+        self.rate_limiter.acquire()
+        response = self.requests_session.send(prepared_request, timeout=self.timeout)
+        self.rate_limiter.observe(response)
+
+        # reference data responses say nothing about the size of stream requests
+        super().validate_response(response)
+
+        return response
+
     @cached_property
     def utc_timezone_id(self):
         """Resolve UTC timezone ID from API."""
-        response = self.requests_session.get(f"{self.url_base}/meta/timezones")
-        response.raise_for_status()
-        timezones: list[dict] = response.json()["timezones"]
+        # refresh cached timezones once if they are missing UTC
+        for refresh in (False, True):
+            timezones: list[dict] = self.get_metadata(
+                "/meta/timezones", refresh=refresh
+            )["timezones"]
 
-        for tz in timezones:
-            if tz["timezone"] == str(timezone.utc):
-                return tz["timezone_id"]
+            for tz in timezones:
+                if tz["timezone"] == str(timezone.utc):
+                    return tz["timezone_id"]
 
         msg = "No UTC timezone found"
         raise RuntimeError(msg)
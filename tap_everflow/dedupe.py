@@ -0,0 +1,42 @@
+"""Duplicate record detection for tap-everflow."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class SeenIndex:
+    """Bounded set of recently seen record keys.
+
+    Once `max_size` keys are held, the least recently seen key is forgotten for
+    each new one, so memory use is capped while duplicates emitted close together,
+    as at page and window boundaries, are still caught.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create an index remembering up to `max_size` keys."""
+        self.max_size = max_size
+        self.dropped = 0
+        self._keys: OrderedDict[Hashable, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of keys held."""
+        return len(self._keys)
+
+    def add(self, key: Hashable) -> bool:
+        """Add `key`, returning `False` and counting a duplicate if already seen."""
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            self.dropped += 1
+            return False
+
+        self._keys[key] = None
+
+        if len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+
+        return True
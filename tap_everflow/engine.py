@@ -0,0 +1,113 @@
+"""Async request engine for tap-everflow."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+    from concurrent.futures import Future
+
+
+class AsyncEngine:
+    """Send requests as coroutines on a single event loop thread.
+
+    Requests prepared by any stream are sent through one shared `httpx.AsyncClient`,
+    with at most `max_concurrency` in flight across the whole tap. Responses are
+    converted back to `requests.Response` objects, so validation, parsing and
+    pagination work the same as for the default engine.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        """Start the event loop thread."""
+        if httpx is None:
+            msg = (
+                "The async request engine requires httpx, install it with "
+                "`pip install tap-everflow[async]`"
+            )
+            raise RuntimeError(msg)
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="everflow-async",
+            daemon=True,
+        )
+        self._thread.start()
+        self.run(self._start(max_concurrency))
+
+    async def _start(self, max_concurrency: int) -> None:
+        # created on the loop thread so they are bound to its event loop
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency),
+        )
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """Schedule a coroutine on the event loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any]) -> Any:  # noqa: ANN401
+        """Run a coroutine on the event loop and wait for its result."""
+        return self.submit(coro).result()
+
+    async def send(
+        self,
+        prepared_request: requests.PreparedRequest,
+        *,
+        timeout: float,
+    ) -> requests.Response:
+        """Send a prepared request."""
+        async with self._semaphore:
+            try:
+                response = await self._client.request(
+                    str(prepared_request.method),
+                    str(prepared_request.url),
+                    headers=dict(prepared_request.headers),
+                    content=prepared_request.body,
+                    timeout=timeout,
+                )
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(e, request=prepared_request) from e
+            except httpx.TransportError as e:
+                raise requests.exceptions.ConnectionError(
+                    e, request=prepared_request
+                ) from e
+
+        return self._to_requests_response(prepared_request, response)
+
+    @staticmethod
+    def _to_requests_response(
+        prepared_request: requests.PreparedRequest,
+        response: httpx.Response,
+    ) -> requests.Response:
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.url = str(response.url)
+        result.encoding = response.encoding
+        result.elapsed = response.elapsed
+        result.request = prepared_request
+        result._content = response.content  # noqa: SLF001
+        result._content_consumed = True  # type: ignore[attr-defined]  # noqa: SLF001
+        return result
+
+    def close(self) -> None:
+        """Close the client and stop the event loop thread."""
+        if not self._loop.is_running():
+            return
+
+        self.run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
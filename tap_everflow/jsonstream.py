@@ -0,0 +1,130 @@
+"""Incremental JSON parsing for Everflow report responses."""
+
+from __future__ import annotations
+
+import codecs
+import decimal
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder(parse_float=decimal.Decimal)
+
+
+class _Reader:
+    """Buffer of decoded text fed from an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read the next chunk into the buffer, discarding consumed text."""
+        if self.eof:
+            return False
+
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            text = self._decoder.decode(b"", final=True)
+            self.eof = True
+        else:
+            text = self._decoder.decode(chunk)
+
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty string."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`."""
+        if self.peek() != char:
+            msg = f"Expecting '{char}'"
+            raise json.JSONDecodeError(msg, self.buffer, self.pos)
+
+        self.pos += 1
+
+    def value(self) -> Any:  # noqa: ANN401
+        """Decode the next complete JSON value."""
+        self.peek()
+
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+
+def iter_records(
+    chunks: Iterable[bytes],
+    records_key: str,
+    envelope: dict[str, Any],
+) -> Iterator[Any]:
+    """Yield items of a top-level array as the response body is read.
+
+    All other top-level values are decoded into `envelope`, where the records array
+    is kept as a list of only its first item.
+    """
+    reader = _Reader(chunks)
+    reader.expect("{")
+
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+
+        if key == records_key and reader.peek() == "[":
+            reader.pos += 1
+            envelope[key] = []
+
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    record = reader.value()
+
+                    if not envelope[key]:
+                        envelope[key].append(record)
+
+                    yield record
+
+                    if reader.peek() == "]":
+                        reader.pos += 1
+                        break
+
+                    reader.expect(",")
+        else:
+            envelope[key] = reader.value()
+
+        if reader.peek() == "}":
+            return
+
+        reader.expect(",")
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+import math
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, NamedTuple
 
 from singer_sdk.pagination import BaseAPIPaginator
 from typing_extensions import override
 
 if TYPE_CHECKING:
+    from tap_everflow.client import EverflowStream
     from tap_everflow.streams import ClicksStream
 
 
@@ -17,12 +18,13 @@ class EverflowPaginator(BaseAPIPaginator):
     """Everflow paginator."""
 
     @override
-    def __init__(self) -> None:
+    def __init__(self, stream: EverflowStream) -> None:
         super().__init__(None)
+        self.stream = stream
 
     @override
     def has_more(self, response):
-        paging = response.json()["paging"]
+        paging = self.stream.parse_json(response)["paging"]
 
         page: int = paging["page"]
         page_size: int = paging["page_size"]
@@ -32,27 +34,91 @@ class EverflowPaginator(BaseAPIPaginator):
 
     @override
     def get_next(self, response):
-        paging = response.json()["paging"]
+        paging = self.stream.parse_json(response)["paging"]
         return paging["page"] + 1
 
+    def get_last(self, response) -> int:
+        """Get the number of the last page, as reported by any page."""
+        paging = self.stream.parse_json(response)["paging"]
+        return math.ceil(paging["total_count"] / paging["page_size"])
+
+
+class ClicksWindow(NamedTuple):
+    """Bounds of a clicks request.
+
+    With `page` set, the request is for that page of `page_size` clicks in the
+    second at `start`, before continuing up to `end`.
+    """
+
+    start: datetime
+    end: datetime
+    page: int | None = None
+    page_size: int | None = None
+
 
 class ClicksPaginator(BaseAPIPaginator):
     """Clicks paginator."""
 
     @override
-    def __init__(self, stream: ClicksStream) -> None:
-        super().__init__(None)
+    def __init__(
+        self, stream: ClicksStream, window: ClicksWindow | None = None
+    ) -> None:
+        super().__init__(window)
         self.stream = stream
+        self.window = window
 
     @override
     def get_next(self, response):
-        next_value: int = response.json()["clicks"][0][self.stream.replication_key]
-        next_date = datetime.fromtimestamp(next_value, tz=timezone.utc)
-
-        if (
-            next_date.strftime(r"%Y-%m-%d %H:%M:%S")
-            == json.loads(response.request.body)["from"]
-        ):  # if next date is equal to the last requested from date
-            return None  # end pagination
+        timestamps = self.stream.get_page_timestamps(response)
+        current = self.current_value
+
+        if isinstance(current, ClicksWindow) and current.page and current.page_size:
+            if len(timestamps) < current.page_size:
+                return self._continue_from(current.start + timedelta(seconds=1))
+
+            return current._replace(page=current.page + 1)
+
+        if not timestamps:
+            return None
+
+        payload = self.stream.request_payload(response.request)
+        from_date, to_date = (
+            datetime.strptime(payload[k], r"%Y-%m-%d %H:%M:%S").replace(
+                tzinfo=timezone.utc
+            )
+            for k in ("from", "to")
+        )
+        next_date = datetime.fromtimestamp(max(timestamps), tz=timezone.utc)
+
+        if next_date != from_date:
+            # the latest second may continue on the next page, so start from it
+            self.stream.largest_page = max(self.stream.largest_page, len(timestamps))
+        elif len(timestamps) < self.stream.largest_page:
+            return None  # the requested second was the last in the window
+        else:
+            # the whole page is one second, which may hold more clicks than a page,
+            # so page through it by offset, from the start as the order of clicks
+            # within a second is not known
+            self.stream.logger.info(
+                "%d clicks at %s filled a page, requesting that second in pages",
+                len(timestamps),
+                from_date,
+            )
+
+            return ClicksWindow(
+                from_date,
+                self.window.end if self.window else to_date,
+                page=1,
+                page_size=len(timestamps),
+            )
+
+        return self._continue_from(next_date)
+
+    def _continue_from(self, next_date: datetime) -> ClicksWindow | datetime | None:
+        if self.window:
+            if next_date > self.window.end:
+                return None
+
+            return self.window._replace(start=next_date)
 
         return next_date
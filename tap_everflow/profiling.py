@@ -0,0 +1,125 @@
+"""Sampling profiler for tap-everflow syncs."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import FrameType, TracebackType
+
+#: Phase of a sync each function belongs to, and any function it calls.
+PHASES = {
+    "prepare_request_payload": "prepare_request_payload",
+    "_request": "request",
+    "_request_async": "request",
+    "_fetch_metadata": "request",
+    "parse_response": "parse",
+    "parse_json": "parse",
+    "post_process": "post_process",
+    "_write_record_message": "write",
+    "_write_state_message": "write",
+    "_write_batch_message": "write",
+}
+
+#: Modules phase functions are defined in.
+PHASE_MODULES = ("tap_everflow.", "singer_sdk.")
+
+
+def _get_frame_name(frame: FrameType) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_name}"
+
+
+class StackSampler:
+    """Sampling profiler for the threads syncing a stream.
+
+    While running, the stacks of the thread that started it, from the function that
+    started it, and of any worker threads named after the stream are sampled every
+    `interval` seconds from a background thread, so the profiled code runs at full
+    speed in between. Each stack is labelled with the phase of the sync it was
+    sampled in, as found from the innermost function in `PHASES`, or `sync`
+    otherwise.
+    """
+
+    def __init__(self, name: str, interval: float = 0.005) -> None:
+        """Create a sampler for stream `name`."""
+        self.name = name
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._thread_id: int | None = None
+        self._root: FrameType | None = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"profile-{name}",
+            daemon=True,
+        )
+
+    def __enter__(self) -> Self:
+        """Start sampling the current thread and stream worker threads."""
+        self._thread_id = threading.get_ident()
+        self._root = sys._getframe(1)  # noqa: SLF001
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop sampling."""
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Take the stack of every sampled thread."""
+        frames = sys._current_frames()  # noqa: SLF001
+        thread_ids = {self._thread_id} | {
+            thread.ident
+            for thread in threading.enumerate()
+            if thread.name.startswith(f"{self.name}_")
+        }
+
+        for thread_id in thread_ids:
+            if frame := frames.get(thread_id):  # type: ignore[arg-type]
+                self.samples[self._collapse(frame)] += 1
+
+    def _collapse(self, frame: FrameType | None) -> str:
+        names = []
+        phase = None
+
+        while frame:
+            name = frame.f_code.co_name
+
+            if (
+                phase is None
+                and name in PHASES
+                and frame.f_globals.get("__name__", "").startswith(PHASE_MODULES)
+            ):
+                phase = PHASES[name]
+
+            names.append(_get_frame_name(frame))
+
+            # leave out the callers of the profiled code
+            frame = frame.f_back if frame is not self._root else None
+
+        return ";".join([phase or "sync", *reversed(names)])
+
+    def write(self, path: Path) -> None:
+        """Write the samples as collapsed stacks, as read by flame graph tools."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "".join(
+                f"{stack} {count}\n" for stack, count in sorted(self.samples.items())
+            )
+        )
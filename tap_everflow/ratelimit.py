@@ -0,0 +1,110 @@
+"""Client-side rate limiting for tap-everflow."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+#: Rate limit reset values above this are read as a Unix timestamp, not seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimiter:
+    """Token bucket shared by every request sent with an API key.
+
+    Requests take a token each, refilled at `rate` per second up to `burst`. Tokens
+    are reserved in call order, so callers queue fairly rather than race. When the
+    API asks the client to wait, through `Retry-After` or an exhausted rate limit,
+    every caller is paused until then.
+    """
+
+    def __init__(self, rate: float | None = None, burst: int = 1) -> None:
+        """Create a limiter allowing `rate` requests per second, or unlimited."""
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(self._paused_until - now, 0)
+
+            if self.rate:
+                elapsed = now - self._updated
+                self._tokens = min(self._tokens + elapsed * self.rate, self.burst)
+                self._updated = now
+                self._tokens -= 1
+
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self.rate)
+
+            return delay
+
+    def acquire(self) -> None:
+        """Wait for a token."""
+        delay = self.reserve()
+
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        delay = self.reserve()
+
+        if delay:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    @property
+    def remaining_pause(self) -> float:
+        """Seconds until requests are no longer held back."""
+        return max(self._paused_until - time.monotonic(), 0)
+
+    def observe(self, response: requests.Response) -> None:
+        """Pause for as long as the rate limit headers of a response ask."""
+        seconds = get_retry_after(response)
+
+        if seconds is not None:
+            self.pause(seconds)
+
+
+def get_retry_after(response: requests.Response) -> float | None:
+    """Get how long a response asks the client to wait before the next request."""
+    headers = response.headers
+
+    if "Retry-After" in headers:
+        return _parse_delay(headers["Retry-After"])
+
+    if headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+        return _parse_delay(headers["X-RateLimit-Reset"])
+
+    return None
+
+
+def _parse_delay(value: str) -> float | None:
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    else:
+        if seconds > _EPOCH_THRESHOLD:
+            seconds -= time.time()
+
+    return max(seconds, 0)
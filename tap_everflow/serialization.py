@@ -0,0 +1,43 @@
+"""JSON encoding and decoding for tap-everflow."""
+
+from __future__ import annotations
+
+import decimal
+import json
+from typing import Any
+
+from singer_sdk.singerlib.json import serialize_json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+#: Name of the JSON library in use.
+BACKEND = "orjson" if orjson else "json"
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode JSON.
+
+    With orjson, decimal numbers are decoded as floats, otherwise as `Decimal`.
+    """
+    if orjson:
+        return orjson.loads(data)
+
+    return json.loads(data, parse_float=decimal.Decimal)
+
+
+def dumps(obj: Any) -> str:  # noqa: ANN401
+    """Encode a Singer message as a line of JSON.
+
+    The output has the same meaning as the SDK's encoding. Values orjson cannot
+    encode exactly, such as `Decimal`, fall back to the SDK for the whole message.
+    """
+    if orjson:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            pass
+
+    return serialize_json(obj)
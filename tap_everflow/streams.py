@@ -2,15 +2,47 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from functools import cached_property
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable
+from weakref import WeakKeyDictionary
 
+from singer_sdk import metrics
 from singer_sdk import typing as th
 from typing_extensions import override
 
 from tap_everflow import schemas
 from tap_everflow.client import EverflowStream
-from tap_everflow.pagination import ClicksPaginator
+from tap_everflow.pagination import ClicksPaginator, ClicksWindow
+from tap_everflow.telemetry import Metric
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+
+    import requests
+
+    from tap_everflow.adaptive import AdaptiveSize
+
+CLICKS_SHARD_INTERVALS = {
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+}
+
+
+class _WindowPages:
+    """Pages of a clicks window requested ahead of being emitted."""
+
+    def __init__(self, paginator: ClicksPaginator) -> None:
+        self.paginator = paginator
+        self.responses: deque[requests.Response] = deque()
+        self.request: tuple[requests.PreparedRequest, Future] | None = None
+        self.finished = False
+        self.count = 0
 
 
 class OffersStream(EverflowStream):
@@ -22,8 +54,7 @@ class OffersStream(EverflowStream):
     records_jsonpath = "$.offers[*]"
 
     @override
-    @cached_property
-    def schema(self):
+    def build_schema(self):
         return th.PropertiesList(
             th.Property("network_offer_id", th.IntegerType),
             th.Property("network_id", th.IntegerType),
@@ -275,11 +306,41 @@ class OffersStream(EverflowStream):
         ).to_dict()
 
     @override
-    def post_process(self, row, context=None):
-        if not row.get("date_live_until"):
-            row["date_live_until"] = None
+    @property
+    def emit_activate_version_messages(self):
+        # unchanged offers are not emitted, so activating a new version of the table
+        # would remove them from the target
+        return (
+            not self.config.get("offers_change_detection")
+            and super().emit_activate_version_messages
+        )
 
-        return row
+    @override
+    def get_records(self, context):
+        if not self.config.get("offers_change_detection"):
+            yield from super().get_records(context)
+            return
+
+        state = self.get_context_state(context)
+        previous = state.get("fingerprints", {})
+        fingerprints = {}
+
+        for record in super().get_records(context):
+            offer_id = str(record["network_offer_id"])
+            fingerprints[offer_id] = fingerprint = self._get_fingerprint(record)
+
+            if previous.get(offer_id) != fingerprint:
+                yield record
+
+        # only replaced once every offer has been seen, so offers missing from the
+        # index after an interrupted sync are emitted again next time
+        with self.state_lock:
+            state["fingerprints"] = fingerprints
+
+    @staticmethod
+    def _get_fingerprint(record: dict) -> str:
+        data = json.dumps(record, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
 
 
 class ConversionsStream(EverflowStream):
@@ -292,11 +353,13 @@ class ConversionsStream(EverflowStream):
     path = "/networks/reporting/conversions"
     records_jsonpath = "$.conversions[*]"
 
+    _end_date: datetime | None = None
+
     @override
-    @cached_property
-    def schema(self):
+    def build_schema(self):
         return th.PropertiesList(
             th.Property("conversion_id", th.StringType),
+            th.Property("network_id", th.IntegerType),  # from accounts
             th.Property("conversion_unix_timestamp", th.IntegerType),
             th.Property("sub1", th.StringType),
             th.Property("sub2", th.StringType),
@@ -374,17 +437,170 @@ class ConversionsStream(EverflowStream):
         ).to_dict()
 
     @override
-    def prepare_request_payload(self, context, next_page_token):
-        start_value: int | str = self.get_starting_replication_key_value(context)
-        start_date = (
-            datetime.fromtimestamp(start_value, tz=timezone.utc)
+    @property
+    def partitions(self):
+        partition_days: int | None = self.config.get("conversions_partition_days")
+
+        if not partition_days:
+            return super().partitions
+
+        if not self.account and (accounts := self.config.get("accounts")):
+            return [
+                partition
+                for account in accounts
+                for partition in self.for_account(account).partitions
+            ]
+
+        interval = timedelta(days=partition_days).total_seconds()
+        now = datetime.now(tz=timezone.utc).timestamp()
+
+        # resume after completed windows, or from a bookmark written before the
+        # stream was partitioned
+        bookmark = (
+            None if self.account else self.stream_state.get("replication_key_value")
+        )
+        start_value: int | str = self.watermark or bookmark or self.start_date
+        start_timestamp = (
+            start_value
             if isinstance(start_value, int)
-            else datetime.fromisoformat(start_value).astimezone(timezone.utc)
+            else datetime.fromisoformat(start_value).timestamp()
         )
 
+        # align windows to the partition size so their contexts, and therefore their
+        # state, line up between runs
+        window_start = start_timestamp // interval * interval
+        context = {"network_id": self.account["network_id"]} if self.account else {}
+        partitions = []
+
+        while window_start < now:
+            window_end = window_start + interval
+            partitions.append(
+                {
+                    **context,
+                    "from": datetime.fromtimestamp(
+                        window_start, tz=timezone.utc
+                    ).isoformat(),
+                    "to": datetime.fromtimestamp(
+                        window_end, tz=timezone.utc
+                    ).isoformat(),
+                }
+            )
+            window_start = window_end
+
+        return partitions
+
+    @property
+    def watermark(self) -> str | None:
+        """End of the leading run of completed windows synced for the account."""
+        if self.account:
+            return self.stream_state.get("watermarks", {}).get(
+                str(self.account["network_id"])
+            )
+
+        return self.stream_state.get("watermark")
+
+    @watermark.setter
+    def watermark(self, value: str) -> None:
+        if self.account:
+            watermarks = self.stream_state.setdefault("watermarks", {})
+            watermarks[str(self.account["network_id"])] = value
+        else:
+            self.stream_state["watermark"] = value
+
+    @override
+    def get_records(self, context):
+        if not context or "from" not in context:
+            yield from super().get_records(context)
+            return
+
+        window_end = datetime.fromisoformat(context["to"])
+
+        if (watermark := self.watermark) and window_end <= datetime.fromisoformat(
+            watermark
+        ):
+            self.logger.info("Skipping partition before the watermark: %s", context)
+            return
+
+        state = self.get_context_state(context)
+
+        if state.get("complete"):
+            self.logger.info("Skipping completed partition: %s", context)
+            return
+
+        self._advance_watermark(context)
+        is_closed = window_end <= datetime.now(tz=timezone.utc)
+
+        yield from super().get_records(context)
+
+        if is_closed:
+            # nothing new can be reported for a window entirely in the past, so
+            # checkpoint it as complete straight away to avoid refetching it
+            with self.state_lock:
+                state["complete"] = True
+
+                if self.get_batch_config(self.config):
+                    # written after the batch holding the last records of the window
+                    self._finalize_state(state)
+                else:
+                    self.finalize_state_progress_markers(state)
+
+    def _advance_watermark(self, context: dict) -> None:
+        """Collapse the leading run of completed windows into a single watermark.
+
+        Only windows ending before the partition about to sync are collapsed, so
+        its own state is left in place.
+        """
+        window_start = datetime.fromisoformat(context["from"])
+
+        with self.state_lock:
+            partition_states: list[dict] = self.stream_state.get("partitions", [])
+            completed = {
+                (p["context"].get("network_id"), p["context"]["from"]): p
+                for p in partition_states
+                if p.get("complete")
+            }
+
+            for partition in self.partitions:
+                if datetime.fromisoformat(partition["to"]) > window_start:
+                    break
+
+                partition_state = completed.get(
+                    (partition.get("network_id"), partition["from"])
+                )
+
+                if not partition_state or partition_state["context"] != partition:
+                    break
+
+                partition_states.remove(partition_state)
+                self.watermark = partition["to"]
+
+    @override
+    def _process_record(self, record, child_context=None, partition_context=None):
+        # partition contexts hold the window bounds, which are not record properties
+        super()._process_record(record, child_context=child_context)
+
+    @override
+    def request_records(self, context):
+        # pin the end of the range, so every page is counted against the same total
+        self._end_date = datetime.now(tz=timezone.utc)
+
+        try:
+            yield from super().request_records(context)
+        finally:
+            self._end_date = None
+
+    @override
+    def prepare_request_payload(self, context, next_page_token):
+        start_date = self._get_start_date(context)
+        end_date = self._end_date or datetime.now(tz=timezone.utc)
+
+        if context and "from" in context:
+            start_date = max(start_date, datetime.fromisoformat(context["from"]))
+            end_date = min(end_date, datetime.fromisoformat(context["to"]))
+
         return {
             "from": start_date.strftime(r"%Y-%m-%d %H:%M:%S"),
-            "to": datetime.now(tz=timezone.utc).strftime(r"%Y-%m-%d %H:%M:%S"),
+            "to": end_date.strftime(r"%Y-%m-%d %H:%M:%S"),
             "timezone_id": self.utc_timezone_id,
             "show_conversions": True,
             "show_events": True,
@@ -401,15 +617,60 @@ class ClicksStream(EverflowStream):
     path = "/networks/reporting/clicks/stream"
     records_jsonpath = "$.clicks[*]"
 
+    #: Most clicks returned by a request whose page ended mid-range.
+    largest_page = 0
+
+    #: Pages each window requested ahead of the one being emitted may hold.
+    window_read_ahead = 2
+
+    account_properties = (*EverflowStream.account_properties, "window_size")
+
+    @override
+    def _init_sync_state(self) -> None:
+        super()._init_sync_state()
+        self._page_timestamps: WeakKeyDictionary[requests.Response, list[int]] = (
+            WeakKeyDictionary()
+        )
+
     @override
     def get_new_paginator(self):
         return ClicksPaginator(self)
 
     @override
+    def parse_response(self, response):
+        timestamps = self._page_timestamps[response] = []
+
+        for record in super().parse_response(response):
+            timestamps.append(record[self.replication_key])
+            yield record
+
+    def get_page_timestamps(self, response: requests.Response) -> list[int]:
+        """Get the timestamp of every click in a parsed response."""
+        try:
+            return self._page_timestamps[response]
+        except KeyError:
+            clicks = self.parse_json(response)["clicks"]
+            return [c[self.replication_key] for c in clicks]
+
     @cached_property
-    def schema(self):
+    def window_size(self) -> AdaptiveSize:
+        """Length of the date range requested at once, in seconds."""
+        return self._get_adaptive_size(
+            timedelta(days=14).total_seconds(),
+            minimum=timedelta(hours=1).total_seconds(),
+            maximum=timedelta(days=14).total_seconds(),
+        )
+
+    @override
+    @property
+    def adaptive_size(self):
+        return self.window_size
+
+    @override
+    def build_schema(self):
         return th.PropertiesList(
             th.Property("transaction_id", th.StringType),
+            th.Property("network_id", th.IntegerType),  # from accounts
             th.Property("is_unique", th.IntegerType),
             th.Property("unix_timestamp", th.IntegerType),
             th.Property("tracking_url", th.StringType),
@@ -522,18 +783,273 @@ class ClicksStream(EverflowStream):
         ).to_dict()
 
     @override
-    def prepare_request_payload(self, context, next_page_token):
-        start_value: datetime | int | str = (
-            next_page_token or self.get_starting_replication_key_value(context)
+    def request_records(self, context):
+        state = self.get_context_state(context)
+
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            if interval := self.config.get("clicks_shard_interval"):
+                pages = self._request_windows_concurrently(
+                    context,
+                    self._get_shard_windows(context, CLICKS_SHARD_INTERVALS[interval]),
+                    request_counter,
+                )
+            else:
+                pages = (
+                    (window, page)
+                    for window in self._get_windows(context)
+                    for page in self._iter_window(context, window, request_counter)
+                )
+
+            cursor: dict = state.get("cursor", {})
+            synced_timestamp: int | None = cursor.get(self.replication_key)
+            synced_ids: list[str] = cursor.get("transaction_ids", [])
+
+            # clicks in a page are in no particular order, but each page starts from
+            # the latest second of the one before, so anything before the cursor was
+            # already synced, and the cursor moves once a whole page is emitted
+            for window, records in pages:
+                self._write_window(state, window)
+                skipped = set(synced_ids)
+                latest_timestamp, latest_ids = synced_timestamp, list(synced_ids)
+
+                for record in records:
+                    timestamp: int = record[self.replication_key]
+                    transaction_id: str = record["transaction_id"]
+
+                    if synced_timestamp is not None and (
+                        timestamp < synced_timestamp
+                        or (timestamp == synced_timestamp and transaction_id in skipped)
+                    ):
+                        continue
+
+                    if latest_timestamp is None or timestamp > latest_timestamp:
+                        latest_timestamp, latest_ids = timestamp, []
+
+                    if timestamp == latest_timestamp:
+                        latest_ids.append(transaction_id)
+
+                    yield record
+
+                if latest_ids:
+                    synced_timestamp, synced_ids = latest_timestamp, latest_ids
+                    self._write_cursor(state, synced_timestamp, synced_ids)
+
+        with self.state_lock:
+            state.pop("window", None)
+            state.pop("position", None)
+
+    @override
+    def _increment_stream_state(self, latest_record, *, context=None):
+        with self.state_lock:
+            super()._increment_stream_state(latest_record, context=context)
+
+            state = self.get_context_state(context)
+            state["position"] = state.get("position", 0) + 1
+
+    def _write_cursor(
+        self, state: dict, timestamp: int, transaction_ids: list[str]
+    ) -> None:
+        # several clicks can share a second, so keep every transaction ID synced for
+        # the cursor second
+        with self.state_lock:
+            state["cursor"] = {
+                self.replication_key: timestamp,
+                "transaction_id": transaction_ids[-1],
+                "transaction_ids": transaction_ids,
+            }
+
+    @override
+    def _get_start_date(self, context):
+        if cursor := self.get_context_state(context).get("cursor"):
+            return datetime.fromtimestamp(cursor[self.replication_key], tz=timezone.utc)
+
+        return super()._get_start_date(context)
+
+    def _write_window(self, state: dict, window: ClicksWindow) -> None:
+        with self.state_lock:
+            if state.get("window", {}).get("to") == window.end.isoformat():
+                return  # resumed
+
+            state["window"] = {
+                "from": window.start.isoformat(),
+                "to": window.end.isoformat(),
+            }
+            state["position"] = 0
+
+    def _get_windows(self, context):
+        from_date, to_date = self._get_request_bounds(self._get_start_date(context))
+        window = self.get_context_state(context).get("window")
+
+        # resume an interrupted window up to where it originally ended
+        if window and from_date < datetime.fromisoformat(window["to"]):
+            to_date = datetime.fromisoformat(window["to"])
+
+            self.logger.info(
+                "Resuming clicks window %s to %s from %s, after %d records",
+                window["from"],
+                window["to"],
+                from_date,
+                self.get_context_state(context).get("position", 0),
+            )
+
+        end = datetime.now(tz=timezone.utc)
+
+        while from_date < end:
+            yield ClicksWindow(from_date, to_date)
+            from_date = to_date
+            _, to_date = self._get_request_bounds(from_date)
+            to_date = min(to_date, end)
+
+    def _get_shard_windows(self, context, interval: timedelta):
+        from_date, _ = self._get_request_bounds(self._get_start_date(context))
+        now = datetime.now(tz=timezone.utc)
+
+        # align windows to the interval so they line up between runs
+        boundary = datetime.fromtimestamp(
+            from_date.timestamp()
+            // interval.total_seconds()
+            * interval.total_seconds(),
+            tz=timezone.utc,
         )
 
-        if isinstance(start_value, datetime):  # from paginator
-            start_date = start_value
-        elif isinstance(start_value, int):  # from state
-            start_date = datetime.fromtimestamp(start_value, tz=timezone.utc)
-        else:  # from config
-            start_date = datetime.fromisoformat(start_value).astimezone(timezone.utc)
+        while from_date < now:
+            boundary = min(boundary + interval, now)
+
+            # both bounds of a request are inclusive, so end each window a second
+            # before the next one starts
+            end = boundary if boundary == now else boundary - timedelta(seconds=1)
+            yield ClicksWindow(from_date, end)
+            from_date = boundary
+
+    def _iter_window(self, context, window: ClicksWindow, request_counter):
+        paginator = ClicksPaginator(self, window)
+        decorated_request = self.request_decorator(self._request)
+        pages = 0
+
+        while not paginator.finished:
+            prepared_request = self.prepare_request(context, paginator.current_value)
+            response = decorated_request(prepared_request, context)
+            request_counter.increment()
+            self.update_sync_costs(prepared_request, response, context)
 
+            # the page is parsed as it is emitted, which records its timestamps for
+            # the paginator
+            yield self.parse_response(response)
+            paginator.advance(response)
+
+            if paginator.finished and not self.get_page_timestamps(response):
+                self._log_empty_page(pages)
+
+            pages += 1
+
+    def _request_windows_concurrently(
+        self, context, windows: Iterable[ClicksWindow], request_counter
+    ):
+        """Request pages of up to `max_concurrency` windows at once.
+
+        Pages are yielded with their window, in order. Windows ahead of the one
+        being emitted stop requesting pages once `window_read_ahead` are waiting, so
+        only a few pages of each are held rather than whole windows.
+        """
+        windows = iter(windows)
+        active: deque[_WindowPages] = deque()
+
+        with self.submitter(self._get_window_fetch(context)) as submit:
+            try:
+                while True:
+                    for window in islice(windows, self.max_concurrency - len(active)):
+                        active.append(_WindowPages(ClicksPaginator(self, window)))
+
+                    if not active:
+                        return
+
+                    for pages in active:
+                        if pages.request and pages.request[1].done():
+                            self._receive_window_page(context, pages, request_counter)
+
+                        self._request_window_page(context, pages, submit)
+
+                    head = active[0]
+
+                    if head.responses:
+                        response = head.responses.popleft()
+                        self._request_window_page(context, head, submit)
+                        yield head.paginator.window, self.parse_response(response)
+                    elif head.request:
+                        self._receive_window_page(context, head, request_counter)
+                    else:
+                        active.popleft()
+            finally:
+                for pages in active:
+                    if pages.request:
+                        pages.request[1].cancel()
+
+    def _get_window_fetch(self, context) -> Callable[[requests.PreparedRequest], Any]:
+        if self.engine:
+            decorated_request_async = self.async_request_decorator(self._request_async)
+
+            async def fetch_async(prepared_request: requests.PreparedRequest):
+                return await decorated_request_async(prepared_request, context)
+
+            return fetch_async
+
+        decorated_request = self.request_decorator(self._request)
+
+        def fetch_sync(prepared_request: requests.PreparedRequest):
+            response = decorated_request(prepared_request, context)
+            self.parse_json(response)  # decode off the main thread
+            return response
+
+        return fetch_sync
+
+    def _request_window_page(
+        self,
+        context,
+        pages: _WindowPages,
+        submit: Callable[[requests.PreparedRequest], Future],
+    ) -> None:
+        if (
+            pages.request
+            or pages.finished
+            or len(pages.responses) >= self.window_read_ahead
+        ):
+            return
+
+        prepared_request = self.prepare_request(context, pages.paginator.current_value)
+        pages.request = prepared_request, submit(prepared_request)
+
+    def _receive_window_page(
+        self, context, pages: _WindowPages, request_counter
+    ) -> None:
+        if not pages.request:
+            return
+
+        prepared_request, future = pages.request
+        pages.request = None
+        response = future.result()
+        request_counter.increment()
+        self.update_sync_costs(prepared_request, response, context)
+
+        pages.paginator.advance(response)
+        pages.finished = pages.paginator.finished
+
+        if self.get_page_timestamps(response):
+            pages.responses.append(response)
+        elif pages.finished:
+            self._log_empty_page(pages.count)
+
+        pages.count += 1
+
+    def _log_empty_page(self, pages: int) -> None:
+        self.logger.info(
+            "Pagination stopped after %d pages because no records were found in the "
+            "last response",
+            pages,
+        )
+
+    def _get_request_bounds(self, start_date: datetime):
         now = datetime.now(tz=timezone.utc)
 
         # min from date is ~3 months from the current date, i.e. approx. 90 days
@@ -542,9 +1058,35 @@ class ClicksStream(EverflowStream):
 
         # max to date is 14 days from start date, i.e. period of 2 weeks
         # https://developers.everflow.io/docs/network/reporting/raw_clicks/#click-report
-        to_date = min(from_date + timedelta(days=14), now)
+        to_date = min(from_date + timedelta(seconds=self.window_size.value), now)
+
+        return from_date, to_date
+
+    @override
+    def get_url_params(self, context, next_page_token):
+        # pages are requested by date range, in the payload, other than within a
+        # second holding more clicks than a page
+        if isinstance(next_page_token, ClicksWindow) and next_page_token.page:
+            return {
+                "page": next_page_token.page,
+                "page_size": next_page_token.page_size,
+            }
+
+        return {}
+
+    @override
+    def prepare_request_payload(self, context, next_page_token):
+        if isinstance(next_page_token, ClicksWindow) and next_page_token.page:
+            from_date = to_date = next_page_token.start  # within a second
+        elif isinstance(next_page_token, ClicksWindow):  # from shard
+            from_date, to_date = next_page_token.start, next_page_token.end
+        elif isinstance(next_page_token, datetime):  # from paginator
+            from_date, to_date = self._get_request_bounds(next_page_token)
+        else:
+            from_date, to_date = self._get_request_bounds(self._get_start_date(context))
 
         self.logger.info("Requesting clicks from %s to %s", from_date, to_date)
+        self.log_metric(Metric.WINDOW_SECONDS, (to_date - from_date).total_seconds())
 
         return {
             "from": from_date.strftime(r"%Y-%m-%d %H:%M:%S"),
@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from singer_sdk import Tap
 from singer_sdk import typing as th  # JSON schema typing helpers
+from singer_sdk.singerlib import Catalog
 from typing_extensions import override
 
-from tap_everflow import streams
+from tap_everflow import catalog, streams
+from tap_everflow.cache import MetadataCache
+from tap_everflow.client import build_session
+from tap_everflow.ratelimit import RateLimiter
+from tap_everflow.telemetry import Telemetry
+from tap_everflow.writer import SerializedSingerWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from singer_sdk.streams import Stream
+
+    from tap_everflow.engine import AsyncEngine
 
 
 class TapEverflow(Tap):
@@ -20,10 +37,45 @@ class TapEverflow(Tap):
         th.Property(
             "api_key",
             th.StringType,
-            required=True,
             secret=True,
             title="API Key",
-            description="Everflow network API key",
+            description="Everflow network API key, required unless `accounts` is set",
+        ),
+        th.Property(
+            "accounts",
+            th.ArrayType(
+                th.ObjectType(
+                    th.Property(
+                        "network_id",
+                        th.IntegerType,
+                        required=True,
+                        title="Network ID",
+                        description="Everflow network ID records are tagged with",
+                    ),
+                    th.Property(
+                        "api_key",
+                        th.StringType,
+                        required=True,
+                        secret=True,
+                        title="API Key",
+                        description="Everflow network API key",
+                    ),
+                    th.Property(
+                        "start_date",
+                        th.DateTimeType,
+                        title="Start Date",
+                        description=(
+                            "The earliest record date to sync, or `start_date` if "
+                            "not set"
+                        ),
+                    ),
+                ),
+            ),
+            title="Accounts",
+            description=(
+                "Everflow networks to sync in place of `api_key`, each as a partition "
+                "of every stream with its own state and rate limit"
+            ),
         ),
         th.Property(
             "start_date",
@@ -32,7 +84,354 @@ class TapEverflow(Tap):
             description="The earliest record date to sync",
             default=(datetime.now(tz=timezone.utc) - timedelta(days=365)).isoformat(),
         ),
+        th.Property(
+            "stream_responses",
+            th.BooleanType,
+            title="Stream Responses",
+            description=(
+                "Parse records as response data is received, rather than buffering "
+                "each page in full"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "max_concurrency",
+            th.IntegerType,
+            title="Max Concurrency",
+            description=(
+                "Maximum number of requests a stream may have in flight at once, "
+                "when the remaining pages are known ahead of time"
+            ),
+            default=1,
+        ),
+        th.Property(
+            "max_requests_per_second",
+            th.NumberType,
+            title="Max Requests Per Second",
+            description=(
+                "Maximum rate of requests sent with each API key across all streams, "
+                "or unlimited if not set"
+            ),
+        ),
+        th.Property(
+            "rate_limit_burst",
+            th.IntegerType,
+            title="Rate Limit Burst",
+            description=(
+                "Number of requests that may be sent at once before "
+                "`max_requests_per_second` applies"
+            ),
+            default=1,
+        ),
+        th.Property(
+            "metadata_cache_path",
+            th.StringType,
+            title="Metadata Cache Path",
+            description=(
+                "File to keep reference data such as the timezone table in between "
+                "runs, or only in memory if not set"
+            ),
+        ),
+        th.Property(
+            "metadata_cache_ttl",
+            th.IntegerType,
+            title="Metadata Cache TTL",
+            description="Number of seconds cached reference data is reused for",
+            default=86400,
+        ),
+        th.Property(
+            "output_buffer_size",
+            th.IntegerType,
+            title="Output Buffer Size",
+            description=(
+                "Number of characters of Singer messages to buffer before writing to "
+                "stdout, or write each message straight away if not set. STATE "
+                "messages are always written straight away"
+            ),
+            default=0,
+        ),
+        th.Property(
+            "output_flush_interval",
+            th.NumberType,
+            title="Output Flush Interval",
+            description=(
+                "Maximum number of seconds to buffer Singer messages for, when "
+                "`output_buffer_size` is set"
+            ),
+            default=1,
+        ),
+        th.Property(
+            "metrics_textfile_path",
+            th.StringType,
+            title="Metrics Textfile Path",
+            description=(
+                "File to write a summary of the metrics logged during the run to when "
+                "it ends, in the Prometheus text format, e.g. for the node exporter "
+                "textfile collector"
+            ),
+        ),
+        th.Property(
+            "profile_dir",
+            th.StringType,
+            title="Profile Directory",
+            description=(
+                "Directory to write a sampling profile of each stream sync to, as "
+                "collapsed stacks labelled by phase for flame graph tools"
+            ),
+        ),
+        th.Property(
+            "max_parallel_streams",
+            th.IntegerType,
+            title="Max Parallel Streams",
+            description="Maximum number of streams to sync at once",
+            default=1,
+        ),
+        th.Property(
+            "max_parallel_accounts",
+            th.IntegerType,
+            title="Max Parallel Accounts",
+            description=(
+                "Maximum number of `accounts` each stream syncs at once, or every "
+                "account if not set"
+            ),
+        ),
+        th.Property(
+            "request_engine",
+            th.StringType,
+            title="Request Engine",
+            description=(
+                "Send concurrent requests from a pool of `threads`, or as coroutines "
+                "on a single `async` event loop (requires the `async` extra)"
+            ),
+            allowed_values=["threads", "async"],
+            default="threads",
+        ),
+        th.Property(
+            "clicks_shard_interval",
+            th.StringType,
+            title="Clicks Shard Interval",
+            description=(
+                "Split the clicks date range into windows of this size, requested up "
+                "to `max_concurrency` at a time"
+            ),
+            allowed_values=["day", "hour"],
+        ),
+        th.Property(
+            "conversions_partition_days",
+            th.IntegerType,
+            title="Conversions Partition Days",
+            description=(
+                "Sync conversions as resumable partitions of this many days, each "
+                "with its own state"
+            ),
+        ),
+        th.Property(
+            "offers_change_detection",
+            th.BooleanType,
+            title="Offers Change Detection",
+            description=(
+                "Only sync offers that are new or changed since the last run, tracked "
+                "by a fingerprint of each offer kept in state"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "dedupe_index_size",
+            th.IntegerType,
+            title="Dedupe Index Size",
+            description=(
+                "Number of recently emitted record keys each stream remembers to drop "
+                "duplicate records requested again at page and window boundaries, or "
+                "0 to emit duplicates"
+            ),
+            default=100_000,
+        ),
+        th.Property(
+            "adaptive_sizing",
+            th.BooleanType,
+            title="Adaptive Sizing",
+            description=(
+                "Adjust the page size, and the clicks date range, between requests "
+                "based on response time, response size and server errors"
+            ),
+            default=False,
+        ),
+        th.Property(
+            "adaptive_target_seconds",
+            th.NumberType,
+            title="Adaptive Target Seconds",
+            description=(
+                "Response time adaptive sizing aims for: slower responses shrink "
+                "requests, responses in under half the time grow them"
+            ),
+            default=30,
+        ),
+        th.Property(
+            "min_page_size",
+            th.IntegerType,
+            title="Min Page Size",
+            description="Smallest page size adaptive sizing may request",
+            default=100,
+        ),
+        th.Property(
+            "max_page_size",
+            th.IntegerType,
+            title="Max Page Size",
+            description="Largest page size adaptive sizing may request",
+            default=2000,
+        ),
     ).to_dict()
+    # either a single API key or a list of accounts
+    config_jsonschema["anyOf"] = [  # noqa: RUF012
+        {"required": ["api_key"]},
+        {"required": ["accounts"]},
+    ]
+
+    message_writer_class = SerializedSingerWriter
+    message_writer: SerializedSingerWriter
+
+    #: Catalog read for discovery and stream schemas instead of building them.
+    catalog_path: Path | None = catalog.CATALOG_PATH
+
+    @override
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.message_writer.buffer_size = self.config.get("output_buffer_size", 0)
+        self.message_writer.flush_interval = self.config.get("output_flush_interval", 1)
+
+    @cached_property
+    def shipped_catalog(self) -> dict | None:
+        """Catalog shipped with the package, if generated for this tap version."""
+        if not self.catalog_path:
+            return None
+
+        return catalog.load(self.catalog_path, self.plugin_version)
+
+    @override
+    @property
+    def _singer_catalog(self):
+        # key properties include the network ID when syncing accounts
+        if self.shipped_catalog and not self.config.get("accounts"):
+            return Catalog.from_dict(self.shipped_catalog)
+
+        return super()._singer_catalog
+
+    @override
+    @property
+    def catalog_dict(self):
+        # discover from a fresh copy of the shipped catalog, if current
+        if (
+            self.catalog_path
+            and not self.config.get("accounts")
+            and (
+                shipped_catalog := catalog.load(self.catalog_path, self.plugin_version)
+            )
+        ):
+            return shipped_catalog
+
+        return super().catalog_dict
+
+    @cached_property
+    def requests_session(self):
+        """HTTP session shared by all streams."""
+        return build_session(self.config)
+
+    @cached_property
+    def metadata_cache(self) -> MetadataCache:
+        """Reference data cache shared by all streams."""
+        return MetadataCache(
+            self.config.get("metadata_cache_path"),
+            self.config.get("metadata_cache_ttl", 86400),
+        )
+
+    @cached_property
+    def rate_limiters(self) -> dict[str, RateLimiter]:
+        """Rate limiter shared by all streams for each API key."""
+        api_keys = [
+            self.config.get("api_key", ""),
+            *(account["api_key"] for account in self.config.get("accounts", [])),
+        ]
+
+        return {
+            api_key: RateLimiter(
+                self.config.get("max_requests_per_second"),
+                self.config.get("rate_limit_burst", 1),
+            )
+            for api_key in api_keys
+        }
+
+    @cached_property
+    def telemetry(self) -> Telemetry:
+        """Summary of the metrics logged by all streams."""
+        return Telemetry()
+
+    @cached_property
+    def request_engine(self) -> AsyncEngine | None:
+        """Async request engine shared by all streams, if enabled."""
+        if self.config.get("request_engine") != "async":
+            return None
+
+        # imported only when enabled, as asyncio and httpx are slow to import
+        from tap_everflow.engine import AsyncEngine  # noqa: PLC0415
+
+        engine = AsyncEngine(max(self.config.get("max_concurrency", 1), 1))
+        weakref.finalize(self, engine.close)
+
+        return engine
+
+    # final in the SDK, which has no hook to sync streams other than one at a time
+    @override  # type: ignore[misc]
+    def sync_all(self) -> None:
+        """Sync all streams, up to `max_parallel_streams` at a time."""
+        max_workers = self.config.get("max_parallel_streams", 1)
+
+        try:
+            if max_workers <= 1:
+                super().sync_all()
+            else:
+                self._sync_all_parallel(max_workers)
+        finally:
+            self.message_writer.flush()
+
+            if path := self.config.get("metrics_textfile_path"):
+                self.telemetry.write_textfile(path)
+
+    def _sync_all_parallel(self, max_workers: int) -> None:
+        self._reset_state_progress_markers()
+        self._set_compatible_replication_methods()
+        if self.state:
+            self._state_writer.write_state(self.state)
+
+        selected_streams = []
+
+        for stream in self.streams.values():
+            if not stream.selected and not stream.has_selected_descendents:
+                self.logger.info("Skipping deselected stream '%s'.", stream.name)
+                continue
+
+            if stream.parent_stream_type:
+                continue
+
+            selected_streams.append(stream)
+
+        executor = ThreadPoolExecutor(max_workers, thread_name_prefix="sync")
+
+        try:
+            for future in as_completed(
+                executor.submit(self._sync_stream, stream)
+                for stream in selected_streams
+            ):
+                future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        for stream in self.streams.values():
+            stream.log_sync_costs()
+
+    @staticmethod
+    def _sync_stream(stream: Stream) -> None:
+        stream.sync()
+        stream.finalize_state_progress_markers()
 
     @override
     def discover_streams(self):
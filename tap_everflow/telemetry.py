@@ -0,0 +1,94 @@
+"""Performance metrics for tap-everflow."""
+
+from __future__ import annotations
+
+import enum
+import threading
+from itertools import groupby
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from singer_sdk.metrics import Tag
+
+if TYPE_CHECKING:
+    from singer_sdk.metrics import Point
+
+#: Tags measurements are summarized by.
+SUMMARY_TAGS = (Tag.STREAM, Tag.ENDPOINT)
+
+
+class Metric(str, enum.Enum):
+    """Performance metrics logged by streams, alongside the SDK metrics."""
+
+    HTTP_RESPONSE_BYTES = "http_response_bytes"
+    HTTP_RETRY_COUNT = "http_retry_count"
+    DECODE_DURATION = "decode_duration"
+    PAGE_RECORD_COUNT = "page_record_count"
+    WINDOW_SECONDS = "window_seconds"
+    OUTPUT_BLOCKED_DURATION = "output_blocked_duration"
+
+    @property
+    def metric_type(self) -> str:
+        """Singer metric type the measurements are logged as."""
+        return "timer" if self.value.endswith("_duration") else "counter"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+class Telemetry:
+    """Running summary of the metrics logged by every stream in a run.
+
+    Each measurement adds to a count and a sum for its metric, stream and endpoint,
+    written out at the end of the run in the Prometheus text format.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty summary."""
+        self._summaries: dict[tuple[str, tuple[tuple[str, str], ...]], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, point: Point) -> None:
+        """Add a logged measurement to the summary."""
+        labels = tuple(
+            (tag.value, str(point.tags[tag]))
+            for tag in SUMMARY_TAGS
+            if tag in point.tags
+        )
+        key = (point.metric.value, labels)
+
+        with self._lock:
+            summary = self._summaries.setdefault(key, [0, 0])
+            summary[0] += 1
+            summary[1] += point.value
+
+    def render(self) -> str:
+        """Format the summary in the Prometheus text exposition format."""
+        lines = []
+
+        with self._lock:
+            summaries = sorted(self._summaries.items())
+
+        for metric, group in groupby(summaries, key=lambda item: item[0][0]):
+            name = f"tap_everflow_{metric}"
+            lines.append(f"# TYPE {name} summary")
+
+            for (_, labels), (count, total) in group:
+                selector = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                selector = f"{{{selector}}}" if selector else ""
+                lines.append(f"{name}_count{selector} {count}")
+                lines.append(f"{name}_sum{selector} {total}")
+
+        return "".join(f"{line}\n" for line in lines)
+
+    def write_textfile(self, path: str | Path) -> None:
+        """Write the summary to `path`, replacing it in one step.
+
+        The file is written in full before it replaces any existing one, so
+        collectors such as the node exporter never read it part way through.
+        """
+        target = Path(path)
+        temp_path = target.with_name(f".{target.name}.tmp")
+        temp_path.write_text(self.render())
+        temp_path.replace(target)
@@ -0,0 +1,228 @@
+"""Compiled record transformers for tap-everflow."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from singer_sdk.helpers._typing import (
+    TypeConformanceLevel,
+    _conform_primitive_property,
+    _is_exclusive_boolean_type,
+    is_object_type,
+    is_uniform_list,
+)
+
+if TYPE_CHECKING:
+    from singer_sdk.singerlib import SelectionMask
+
+#: Converts a value, adding the paths of any properties missing from the schema.
+Converter = Callable[[Any, list], Any]
+
+#: Types decoded from JSON that conform to any schema unchanged.
+_JSON_TYPES = (str, int, bool, type(None))
+
+#: String formats where an empty string means no value.
+_DATE_FORMATS = ("date", "date-time")
+
+
+def compile_transformer(
+    schema: dict,
+    *,
+    mask: SelectionMask | None = None,
+    level: TypeConformanceLevel = TypeConformanceLevel.RECURSIVE,
+) -> Converter:
+    """Compile a schema into a function transforming records in one pass.
+
+    The result is equivalent to pruning properties deselected in `mask` and then
+    conforming the record to `schema` at conformance `level`, as the SDK does for
+    every record, but the schema and selection are walked once, ahead of time, and
+    each record is copied once. Empty strings in date properties become null.
+    """
+    return _compile_object(
+        schema,
+        mask=mask,
+        breadcrumb=(),
+        path="",
+        conform=level != TypeConformanceLevel.NONE,
+        recursive=level == TypeConformanceLevel.RECURSIVE,
+    )
+
+
+def compile_pruner(
+    schema: dict,
+    mask: SelectionMask,
+    breadcrumb: tuple[str, ...] = (),
+) -> Callable[[dict], dict] | None:
+    """Compile a function removing deselected properties from records in place.
+
+    Returns `None` if every property of `schema` is selected.
+    """
+    deselected: list[str] = []
+    pruners: dict[str, Callable[[dict], dict]] = {}
+
+    for name, property_schema in schema.get("properties", {}).items():
+        property_breadcrumb = (*breadcrumb, "properties", name)
+
+        if not mask[property_breadcrumb]:
+            deselected.append(name)
+        elif pruner := compile_pruner(property_schema, mask, property_breadcrumb):
+            pruners[name] = pruner
+
+    if not deselected and not pruners:
+        return None
+
+    def prune(obj: dict) -> dict:
+        for name in deselected:
+            obj.pop(name, None)
+
+        for name, pruner in pruners.items():
+            value = obj.get(name)
+
+            if isinstance(value, dict):
+                pruner(value)
+
+        return obj
+
+    return prune
+
+
+def _compile_object(  # noqa: PLR0913
+    schema: dict,
+    *,
+    mask: SelectionMask | None,
+    breadcrumb: tuple[str, ...],
+    path: str,
+    conform: bool,
+    recursive: bool,
+) -> Converter:
+    converters: dict[str, Converter] = {}
+    deselected: set[str] = set()
+    keep_unmapped = not conform or bool(schema.get("additionalProperties"))
+
+    for name, property_schema in schema.get("properties", {}).items():
+        property_breadcrumb = (*breadcrumb, "properties", name)
+
+        if mask is not None and not mask[property_breadcrumb]:
+            deselected.add(name)
+            continue
+
+        converters[name] = _compile_property(
+            property_schema,
+            mask=mask,
+            breadcrumb=property_breadcrumb,
+            path=f"{path}{name}",
+            conform=conform,
+            recursive=recursive,
+        )
+
+    def transform(obj: dict, unmapped: list) -> dict:
+        output = {}
+
+        for name, value in obj.items():
+            converter = converters.get(name)
+
+            if converter:
+                output[name] = converter(value, unmapped)
+            elif name in deselected:
+                continue
+            elif keep_unmapped:
+                output[name] = value
+            else:
+                unmapped.append(f"{path}{name}")
+
+        return output
+
+    return transform
+
+
+def _compile_property(  # noqa: PLR0913
+    schema: dict,
+    *,
+    mask: SelectionMask | None,
+    breadcrumb: tuple[str, ...],
+    path: str,
+    conform: bool,
+    recursive: bool,
+) -> Converter:
+    if schema and is_uniform_list(schema) and conform:
+        if not recursive:
+            return _compile_primitive(schema, lists=False)
+
+        # deselected properties are not pruned from array items
+        item_schema = schema["items"]
+        convert_item = (
+            _compile_object(
+                item_schema,
+                mask=None,
+                breadcrumb=(),
+                path=f"{path}.",
+                conform=conform,
+                recursive=recursive,
+            )
+            if is_object_type(item_schema)
+            else _compile_primitive(item_schema)
+        )
+        convert_primitive_item = _compile_primitive(item_schema)
+        convert_other = _compile_primitive(schema, lists=False)
+
+        def convert_list(value: Any, unmapped: list) -> Any:  # noqa: ANN401
+            if not isinstance(value, list):
+                return convert_other(value, unmapped)
+
+            return [
+                convert_item(item, unmapped)
+                if isinstance(item, dict)
+                else convert_primitive_item(item, unmapped)
+                for item in value
+            ]
+
+        return convert_list
+
+    if is_object_type(schema) and "properties" in schema:
+        convert_object = _compile_object(
+            schema,
+            mask=mask,
+            breadcrumb=breadcrumb,
+            path=f"{path}.",
+            conform=conform and recursive,
+            recursive=recursive,
+        )
+        convert_other = _compile_primitive(schema) if conform else _keep
+
+        def convert_dict(value: Any, unmapped: list) -> Any:  # noqa: ANN401
+            if isinstance(value, dict):
+                return convert_object(value, unmapped)
+
+            return convert_other(value, unmapped)
+
+        return convert_dict
+
+    if not conform:
+        return _keep
+
+    return _compile_primitive(schema)
+
+
+def _compile_primitive(schema: dict, *, lists: bool = True) -> Converter:
+    is_boolean = _is_exclusive_boolean_type(schema)
+    is_date = schema.get("format") in _DATE_FORMATS
+
+    def convert(value: Any, _unmapped: list) -> Any:  # noqa: ANN401
+        if is_date and value == "":
+            return None
+
+        if isinstance(value, _JSON_TYPES) and (
+            not is_boolean or value is None or isinstance(value, bool)
+        ):
+            return value
+
+        if not lists and isinstance(value, (list, dict)):
+            return value
+
+        return _conform_primitive_property(value, schema)
+
+    return convert
+
+
+def _keep(value: Any, _unmapped: list) -> Any:  # noqa: ANN401
+    return value
@@ -0,0 +1,70 @@
+"""Singer message writers for tap-everflow."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+
+from singer_sdk.io_base import SingerWriter
+from singer_sdk.singerlib import StateMessage
+from typing_extensions import override
+
+from tap_everflow import serialization
+
+
+class SerializedSingerWriter(SingerWriter):
+    """Singer writer shared by streams syncing in parallel.
+
+    Messages are written one at a time under `lock`, which streams also hold while
+    updating state, so a STATE message never captures a bookmark mid-update. Messages
+    are encoded with orjson, if installed.
+
+    If `buffer_size` is set, messages are buffered and written to stdout together
+    once the buffer holds that many characters or `flush_interval` seconds have
+    passed since the last write, as checked on each message. STATE messages are
+    always written straight away, with any messages buffered before them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the writer lock and buffer."""
+        super().__init__()
+        self.lock = threading.RLock()
+        self.buffer_size = 0
+        self.flush_interval = 1.0
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._flushed_at = time.monotonic()
+
+    @override
+    def serialize_message(self, message):
+        return serialization.dumps(message.to_dict())
+
+    @override
+    def write_message(self, message):
+        with self.lock:
+            if not self.buffer_size:
+                super().write_message(message)
+                return
+
+            line = self.format_message(message) + "\n"
+            self._buffer.append(line)
+            self._buffered += len(line)
+
+            if (
+                isinstance(message, StateMessage)
+                or self._buffered >= self.buffer_size
+                or time.monotonic() - self._flushed_at >= self.flush_interval
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered messages to stdout."""
+        with self.lock:
+            if self._buffer:
+                sys.stdout.write("".join(self._buffer))
+                sys.stdout.flush()
+                self._buffer.clear()
+                self._buffered = 0
+
+            self._flushed_at = time.monotonic()
@@ -0,0 +1,360 @@
+"""Shared fixtures for offline tap-everflow tests."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from tap_everflow import streams
+from tap_everflow.tap import TapEverflow
+from tests.replay import CASSETTES_DIR, Cassette, RecordingAdapter, ReplayAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+UTC_TIMEZONE_ID = 67
+
+#: Time tests run at, to the second.
+NOW = datetime.now(tz=timezone.utc).replace(microsecond=0)
+
+
+def parse_date(value: str) -> int:
+    """Parse a date in a request payload to a Unix timestamp."""
+    return int(
+        datetime.strptime(value, r"%Y-%m-%d %H:%M:%S")
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+def pytest_addoption(parser):
+    """Add an option to record cassettes against the live API."""
+    parser.addoption(
+        "--record-cassettes",
+        action="store_true",
+        help="Record cassettes against the API key in TAP_EVERFLOW_API_KEY",
+    )
+
+
+@pytest.fixture
+def make_tap():
+    """Build a tap configured with a dummy API key and any extra settings."""
+
+    def _make_tap(state=None, **config):
+        return TapEverflow(
+            config={
+                "api_key": "test",
+                "start_date": "2024-01-01T00:00:00+00:00",
+                **config,
+            },
+            state=state,
+        )
+
+    return _make_tap
+
+
+@pytest.fixture
+def tap(make_tap):
+    """Tap configured with a dummy API key."""
+    return make_tap()
+
+
+@pytest.fixture
+def make_response():
+    """Build a JSON response for a request prepared by a stream."""
+
+    def _make_response(stream, body, next_page_token=None, context=None):
+        stream.__dict__["utc_timezone_id"] = UTC_TIMEZONE_ID
+        stream._write_starting_replication_value(context)  # noqa: SLF001
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()  # noqa: SLF001
+        response._content_consumed = True  # noqa: SLF001
+        response.request = stream.prepare_request(context, next_page_token)
+
+        return response
+
+    return _make_response
+
+
+class MockEverflowAdapter(BaseAdapter):
+    """Transport adapter serving responses from a handler function.
+
+    The handler is called with the request path, query parameters and JSON payload,
+    and returns the response body, or a complete response.
+    """
+
+    def __init__(self, handler) -> None:
+        """Create an adapter for `handler`."""
+        super().__init__()
+        self.handler = handler
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):  # noqa: ARG002, D102
+        self.requests.append(request)
+        url = urlsplit(request.url)
+        payload = json.loads(request.body) if request.body else None
+        body = self.handler(url.path, dict(parse_qsl(url.query)), payload)
+
+        if isinstance(body, requests.Response):
+            response = body
+        else:
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps(body).encode()  # noqa: SLF001
+            response._content_consumed = True  # noqa: SLF001
+
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self) -> None:  # noqa: D102
+        pass
+
+
+class OffersHandler:
+    """Mock API handler serving offers.
+
+    Serves `total_count` offers in pages of the requested size, or the offer IDs in
+    each of `pages` as given. The most requests handled at once is kept in
+    `max_in_flight`.
+    """
+
+    def __init__(
+        self,
+        total_count: int = 0,
+        *,
+        pages: list[list[int]] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        """Create a handler."""
+        self.total_count = total_count
+        self.pages = pages
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, _path, params, _payload) -> dict:
+        """Get the response body for a request."""
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.in_flight, self.max_in_flight)
+
+        time.sleep(self.delay)
+
+        with self._lock:
+            self.in_flight -= 1
+
+        page = int(params.get("page", 1))
+        offer_ids: Sequence[int]
+
+        if self.pages is None:
+            page_size = int(params["page_size"])
+            total_count = self.total_count
+            start = (page - 1) * page_size
+            offer_ids = range(start, min(start + page_size, total_count))
+        else:
+            page_size = len(self.pages[0])
+            total_count = page_size * len(self.pages)
+            offer_ids = self.pages[page - 1]
+
+        return {
+            "offers": [{"network_offer_id": i} for i in offer_ids],
+            "paging": {
+                "page": page,
+                "page_size": page_size,
+                "total_count": total_count,
+            },
+        }
+
+
+@pytest.fixture
+def offers_handler():
+    """Build a mock API handler serving offers."""
+    return OffersHandler
+
+
+@pytest.fixture
+def clicks_handler():
+    """Build a mock API handler serving clicks.
+
+    Clicks are given as records, or as timestamps identifying them. Each request
+    gets the earliest `page_size` clicks in its range, if set, latest first, or the
+    requested page of them by offset.
+    """
+
+    def _clicks_handler(clicks, page_size=None):
+        clicks = sorted(
+            (
+                c
+                if isinstance(c, dict)
+                else {"transaction_id": str(c), "unix_timestamp": c}
+                for c in clicks
+            ),
+            key=lambda c: c["unix_timestamp"],
+        )
+
+        def handler(_path, params, payload):
+            start, end = (parse_date(payload[k]) for k in ("from", "to"))
+            page = [c for c in clicks if start <= c["unix_timestamp"] <= end]
+
+            if "page" in params:
+                offset = (int(params["page"]) - 1) * int(params["page_size"])
+                page = page[offset : offset + int(params["page_size"])]
+
+            return {"clicks": page[:page_size][::-1]}
+
+        return handler
+
+    return _clicks_handler
+
+
+@pytest.fixture
+def conversions_handler():
+    """Build a mock API handler serving conversions at the given timestamps."""
+
+    def _conversions_handler(timestamps):
+        def handler(_path, _params, payload):
+            start, end = (parse_date(payload[k]) for k in ("from", "to"))
+            conversions = [
+                {"conversion_id": str(ts), "conversion_unix_timestamp": ts}
+                for ts in timestamps
+                if start <= ts <= end
+            ]
+
+            return {
+                "conversions": conversions,
+                "paging": {
+                    "page": 1,
+                    "page_size": 2000,
+                    "total_count": len(conversions),
+                },
+            }
+
+        return handler
+
+    return _conversions_handler
+
+
+@pytest.fixture
+def status_response():
+    """Build a response with a status code and headers, and an empty JSON body."""
+
+    def _status_response(status_code=200, **headers):
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+        response._content = b"{}"  # noqa: SLF001
+        return response
+
+    return _status_response
+
+
+@pytest.fixture
+def mock_api():
+    """Mount a mock Everflow API on a stream's session."""
+
+    def _mock_api(stream, handler):
+        stream.__dict__["utc_timezone_id"] = UTC_TIMEZONE_ID
+        adapter = MockEverflowAdapter(handler)
+        stream.requests_session.mount("https://", adapter)
+        return adapter
+
+    return _mock_api
+
+
+@pytest.fixture
+def mock_server():
+    """Serve a mock Everflow API over HTTP for a stream."""
+    servers = []
+
+    def _mock_server(stream, handler):
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._respond(None)
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                self._respond(json.loads(self.rfile.read(length)))
+
+            def _respond(self, payload):
+                url = urlsplit(self.path)
+                body = json.dumps(
+                    handler(url.path, dict(parse_qsl(url.query)), payload)
+                ).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+        stream.__dict__["utc_timezone_id"] = UTC_TIMEZONE_ID
+        stream.url_base = f"http://127.0.0.1:{server.server_port}"
+        return server
+
+    yield _mock_server
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def replay(request, make_tap, monkeypatch):
+    """Build a tap replaying a cassette, or recording it with `--record-cassettes`.
+
+    The clock streams read is frozen at the time the cassette was recorded, so the
+    same requests are sent.
+    """
+
+    def _replay(name, **config):
+        path = CASSETTES_DIR / f"{name}.json"
+
+        if request.config.getoption("--record-cassettes"):
+            config["api_key"] = os.environ["TAP_EVERFLOW_API_KEY"]
+            cassette = Cassette(
+                path,
+                recorded_at=datetime.now(tz=timezone.utc).replace(microsecond=0),
+                config={k: v for k, v in config.items() if k != "api_key"},
+            )
+            adapter = RecordingAdapter(cassette)
+            request.addfinalizer(cassette.save)
+        else:
+            cassette = Cassette.load(path)
+            config = cassette.config
+            adapter = ReplayAdapter(cassette)
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None) -> FrozenDatetime:
+                return cls.fromtimestamp(cassette.recorded_at.timestamp(), tz=tz)
+
+        monkeypatch.setattr(streams, "datetime", FrozenDatetime)
+
+        tap = make_tap(**config)
+        tap.requests_session.mount("https://", adapter)
+        tap.requests_session.mount("http://", adapter)
+
+        return tap, adapter
+
+    return _replay
@@ -0,0 +1,164 @@
+"""Record and replay Everflow API traffic as cassettes."""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+CASSETTES_DIR = Path(__file__).parent / "cassettes"
+
+#: Request headers left out of cassettes.
+REDACTED_HEADERS = frozenset({"x-eflow-api-key", "authorization"})
+
+
+def _request_key(request: requests.PreparedRequest) -> tuple:
+    url = urlsplit(request.url)
+    body = json.loads(request.body) if request.body else None
+
+    return request.method, url.path, url.query, json.dumps(body, sort_keys=True)
+
+
+class Cassette:
+    """Requests and responses recorded against the API at a point in time.
+
+    Streams derive date ranges from the current time, so a cassette records the
+    time it was recorded at and the config it was recorded with, for replays to
+    send the same requests.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        recorded_at: datetime,
+        config: dict,
+        interactions: list[dict] | None = None,
+    ) -> None:
+        """Create a cassette stored at `path`."""
+        self.path = path
+        self.recorded_at = recorded_at
+        self.config = config
+        self.interactions = interactions or []
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        """Load a cassette saved to `path`."""
+        data = json.loads(path.read_text())
+
+        return cls(
+            path,
+            recorded_at=datetime.fromisoformat(data["recorded_at"]),
+            config=data["config"],
+            interactions=data["interactions"],
+        )
+
+    def save(self) -> None:
+        """Save the cassette to its path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                {
+                    "recorded_at": self.recorded_at.isoformat(),
+                    "config": self.config,
+                    "interactions": self.interactions,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+    def record(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+    ) -> None:
+        """Add a request and its response."""
+        url = urlsplit(request.url)
+
+        self.interactions.append(
+            {
+                "request": {
+                    "method": request.method,
+                    "path": url.path,
+                    "query": url.query,
+                    "headers": {
+                        k: v
+                        for k, v in request.headers.items()
+                        if k.lower() not in REDACTED_HEADERS
+                    },
+                    "body": json.loads(request.body) if request.body else None,
+                },
+                "response": {
+                    "status_code": response.status_code,
+                    "headers": {"Content-Type": response.headers.get("Content-Type")},
+                    "body": response.content.decode(),
+                },
+            }
+        )
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter sending requests and adding them to a cassette."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        """Create an adapter recording to `cassette`."""
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):  # noqa: D102
+        response = super().send(request, **kwargs)
+        self.cassette.record(request, response)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter serving responses from a cassette.
+
+    Requests are matched on method, path, query and JSON body. Responses recorded
+    for the same request are served in the order they were recorded.
+    """
+
+    def __init__(self, cassette: Cassette) -> None:
+        """Create an adapter replaying `cassette`."""
+        super().__init__()
+        self.cassette = cassette
+        self.requests: list[requests.PreparedRequest] = []
+        self._responses: dict[tuple, deque[dict]] = defaultdict(deque)
+
+        for interaction in cassette.interactions:
+            recorded = interaction["request"]
+            key = (
+                recorded["method"],
+                recorded["path"],
+                recorded["query"],
+                json.dumps(recorded["body"], sort_keys=True),
+            )
+            self._responses[key].append(interaction["response"])
+
+    def send(self, request, **kwargs):  # noqa: ARG002, D102
+        self.requests.append(request)
+        key = _request_key(request)
+
+        try:
+            recorded = self._responses[key].popleft()
+        except IndexError:
+            msg = f"No response recorded in {self.cassette.path.name} for {key}"
+            raise LookupError(msg) from None
+
+        response = requests.Response()
+        response.status_code = recorded["status_code"]
+        response.headers.update(recorded["headers"])
+        response._content = recorded["body"].encode()  # noqa: SLF001
+        response._content_consumed = True  # noqa: SLF001
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self) -> None:  # noqa: D102
+        pass
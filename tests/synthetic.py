@@ -0,0 +1,153 @@
+"""Mock Everflow API serving synthetic records."""
+
+from __future__ import annotations
+
+import bisect
+import decimal
+import json
+from datetime import datetime, timedelta, timezone
+
+from singer_sdk.singerlib.json import serialize_json
+
+from tests.conftest import UTC_TIMEZONE_ID, parse_date
+
+
+def fake_value(schema: dict, i: int):
+    """Build a value of every property in `schema`, varied by `i`."""
+    types = schema.get("type", [])
+
+    if "object" in types:
+        return {
+            name: fake_value(property_schema, i)
+            for name, property_schema in schema.get("properties", {}).items()
+        }
+
+    if "array" in types:
+        return [fake_value(schema["items"], i + j) for j in range(2)]
+
+    if "boolean" in types:
+        return i % 2
+
+    if "integer" in types:
+        return i
+
+    if "number" in types:
+        return decimal.Decimal(i) / 4
+
+    return f"value-{i}"
+
+
+def fake_page(schema: dict, size: int = 2000) -> list[dict]:
+    """Build a page of records for `schema`, with properties it does not define."""
+    return [
+        {**fake_value(schema, i), "unknown": i, "relationship": {"unknown": i}}
+        for i in range(size)
+    ]
+
+
+class SyntheticEverflow:
+    """Handler for a mock Everflow API generating pages of any size.
+
+    Serves `offers` offers, and `conversions` conversions and `clicks` clicks
+    spread evenly over the `days` before `now`, each built from the stream schema.
+    At most `clicks_limit` clicks are returned per request, or per page requested by
+    offset.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        tap,
+        *,
+        offers: int = 0,
+        conversions: int = 0,
+        clicks: int = 0,
+        days: int = 7,
+        clicks_limit: int = 10_000,
+        now: datetime | None = None,
+    ) -> None:
+        """Create a handler serving records shaped by the streams of `tap`."""
+        now = now or datetime.now(tz=timezone.utc)
+        start = int((now - timedelta(days=days)).timestamp())
+        seconds = days * 24 * 60 * 60
+
+        self.offers = offers
+        self.clicks_limit = clicks_limit
+        self.templates = {
+            name: json.loads(serialize_json(fake_value(tap.streams[name].schema, 1)))
+            for name in ("offers", "conversions", "clicks")
+        }
+        self.conversion_timestamps = [
+            start + i * seconds // max(conversions, 1) for i in range(conversions)
+        ]
+        self.click_timestamps = [
+            start + i * seconds // max(clicks, 1) for i in range(clicks)
+        ]
+
+    def __call__(self, path: str, params: dict, payload: dict | None) -> dict:
+        """Get the response body for a request."""
+        if path.endswith("/meta/timezones"):
+            return {"timezones": [{"timezone_id": UTC_TIMEZONE_ID, "timezone": "UTC"}]}
+
+        if path.endswith("/networks/offers"):
+            return self._page(
+                "offers",
+                params,
+                range(self.offers),
+                lambda i: {"network_offer_id": i},
+            )
+
+        if path.endswith("/networks/reporting/conversions"):
+            timestamps = self._between(self.conversion_timestamps, payload)
+            return self._page(
+                "conversions",
+                params,
+                timestamps,
+                lambda ts: {
+                    "conversion_id": str(ts),
+                    "conversion_unix_timestamp": ts,
+                },
+            )
+
+        if path.endswith("/networks/reporting/clicks/stream"):
+            timestamps = self._between(self.click_timestamps, payload)
+
+            if "page" in params:
+                offset = (int(params["page"]) - 1) * int(params["page_size"])
+                timestamps = timestamps[offset : offset + int(params["page_size"])]
+
+            return {
+                "clicks": [
+                    {
+                        **self.templates["clicks"],
+                        "transaction_id": str(ts),
+                        "unix_timestamp": ts,
+                    }
+                    for ts in reversed(timestamps[: self.clicks_limit])
+                ]
+            }
+
+        msg = f"Unknown path: {path}"
+        raise ValueError(msg)
+
+    def _page(self, name, params, items, make_keys):
+        page = int(params.get("page", 1))
+        page_size = int(params["page_size"])
+        start = (page - 1) * page_size
+
+        return {
+            name: [
+                {**self.templates[name], **make_keys(item)}
+                for item in items[start : start + page_size]
+            ],
+            "paging": {"page": page, "page_size": page_size, "total_count": len(items)},
+        }
+
+    @staticmethod
+    def _between(timestamps: list[int], payload: dict | None) -> list[int]:
+        if payload is None:
+            msg = "Reporting requests need a date range"
+            raise ValueError(msg)
+
+        start = bisect.bisect_left(timestamps, parse_date(payload["from"]))
+        end = bisect.bisect_right(timestamps, parse_date(payload["to"]))
+        return timestamps[start:end]
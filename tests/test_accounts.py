@@ -0,0 +1,147 @@
+"""Tests for syncing several Everflow accounts in one run."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_everflow.tap import TapEverflow
+from tests.conftest import NOW
+
+ACCOUNTS = [
+    {"network_id": 1, "api_key": "first"},
+    {
+        "network_id": 2,
+        "api_key": "second",
+        "start_date": (NOW - timedelta(days=1)).isoformat(),
+    },
+]
+
+
+def _messages(capsys) -> list[dict]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_accounts_sync(make_tap, mock_api, clicks_handler, capsys):
+    """Accounts sync at once as partitions, each with its own key and start date."""
+    tap = make_tap(start_date=(NOW - timedelta(days=2)).isoformat(), accounts=ACCOUNTS)
+    stream = tap.streams["clicks"]
+    timestamps = [int((NOW - timedelta(hours=i)).timestamp()) for i in range(1, 48)]
+    handle_clicks = clicks_handler(timestamps)
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def handler(path, params, payload):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["now"], in_flight["max"])
+
+        time.sleep(0.05)
+
+        with lock:
+            in_flight["now"] -= 1
+
+        return handle_clicks(path, params, payload)
+
+    adapter = mock_api(stream, handler)
+
+    stream.sync()
+    stream.finalize_state_progress_markers()
+
+    messages = _messages(capsys)
+    records = [m["record"] for m in messages if m["type"] == "RECORD"]
+    schema = next(m for m in messages if m["type"] == "SCHEMA")
+    state = next(m for m in reversed(messages) if m["type"] == "STATE")["value"]
+    first = [r["unix_timestamp"] for r in records if r["network_id"] == 1]
+    second = [r["unix_timestamp"] for r in records if r["network_id"] == 2]
+
+    assert in_flight["max"] == 2
+    assert {r.headers["X-Eflow-API-Key"] for r in adapter.requests} == {
+        "first",
+        "second",
+    }
+    assert schema["key_properties"] == ["network_id", "transaction_id"]
+    assert sorted(first) == sorted(timestamps)
+    assert sorted(second) == sorted(timestamps[:24])
+    assert sorted(
+        (p["context"]["network_id"], p["replication_key_value"])
+        for p in state["bookmarks"]["clicks"]["partitions"]
+    ) == [(1, max(timestamps)), (2, max(timestamps))]
+
+
+def test_conversions_account_partitions(
+    make_tap, mock_api, conversions_handler, capsys
+):
+    """Completed conversion windows are collapsed into a watermark per account."""
+    config = {
+        "start_date": (NOW - timedelta(days=25)).isoformat(),
+        "conversions_partition_days": 7,
+        "accounts": ACCOUNTS,
+    }
+    timestamps = [int((NOW - timedelta(hours=5 * i)).timestamp()) for i in range(100)]
+
+    stream = make_tap(**config).streams["conversions"]
+    mock_api(stream, conversions_handler(timestamps))
+    partitions = stream.partitions
+    first = [p for p in partitions if p["network_id"] == 1]
+    second = [p for p in partitions if p["network_id"] == 2]
+
+    assert 4 <= len(first) <= 5
+    assert 1 <= len(second) <= 2
+
+    stream.sync()
+    state = stream.tap_state
+    conversions_state = state["bookmarks"]["conversions"]
+
+    records = [m["record"] for m in _messages(capsys) if m["type"] == "RECORD"]
+    assert len([r for r in records if r["network_id"] == 1]) == 100
+    assert conversions_state["watermarks"]["1"] == first[-1]["from"]
+    assert sorted(
+        (p["context"] for p in conversions_state["partitions"]),
+        key=lambda context: context["network_id"],
+    ) == [first[-1], second[-1]]
+
+    stream = make_tap(state=state, **config).streams["conversions"]
+    adapter = mock_api(stream, conversions_handler(timestamps))
+
+    assert stream.partitions == [first[-1], second[-1]]
+
+    stream.sync()
+
+    assert len(adapter.requests) == 2
+
+
+def test_account_rate_limiters(make_tap):
+    """Requests are rate limited by API key, across streams."""
+    tap = make_tap(accounts=ACCOUNTS, max_requests_per_second=5)
+    offers = tap.streams["offers"]
+    clicks = tap.streams["clicks"]
+
+    first, second = (offers.for_account(account) for account in ACCOUNTS)
+
+    assert first.rate_limiter is clicks.for_account(ACCOUNTS[0]).rate_limiter
+    assert first.rate_limiter is not second.rate_limiter
+    assert first.requests_session is second.requests_session
+    assert first.schema is second.schema
+
+
+def test_accounts_config():
+    """Either an API key or accounts are required."""
+    with pytest.raises(ConfigValidationError):
+        TapEverflow(config={}, parse_env_config=False)
+
+    tap = TapEverflow(config={"accounts": ACCOUNTS}, parse_env_config=False)
+    catalog = json.loads(tap.catalog_json_text)
+
+    assert {
+        entry["tap_stream_id"]: entry["key_properties"] for entry in catalog["streams"]
+    } == {
+        "clicks": ["network_id", "transaction_id"],
+        "conversions": ["network_id", "conversion_id"],
+        "offers": ["network_id", "network_offer_id"],
+    }
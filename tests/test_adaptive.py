@@ -0,0 +1,125 @@
+"""Tests for adaptive request sizing."""
+
+from __future__ import annotations
+
+import pytest
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_everflow.adaptive import AdaptiveSize
+
+
+@pytest.fixture
+def size():
+    """Adaptive size between 100 and 8000, aiming for 10 second responses."""
+    return AdaptiveSize(
+        2000, minimum=100, maximum=8000, target_seconds=10, max_bytes=1000
+    )
+
+
+def test_grow_when_fast(size):
+    """Fast, small responses grow the size up to the maximum."""
+    for _ in range(5):
+        size.observe(elapsed=1, size=10)
+
+    assert size.value == 8000
+
+
+def test_shrink_when_slow_or_large(size):
+    """Slow or large responses shrink the size."""
+    size.observe(elapsed=20, size=10)
+    assert size.value == 1000
+
+    size.observe(elapsed=1, size=5000)
+    assert size.value == 500
+
+
+def test_hold_near_target(size):
+    """Responses close to the target leave the size unchanged."""
+    size.observe(elapsed=8, size=10)
+
+    assert size.value == 2000
+
+
+def test_page_size_changes_between_runs(make_tap, mock_api):
+    """The page size grows between pagination runs, never mid-run."""
+    stream = make_tap(adaptive_sizing=True, max_page_size=8000).streams["offers"]
+
+    def handler(_path, params, _payload):
+        page = int(params.get("page", 1))
+        page_size = int(params["page_size"])
+        return {
+            "offers": [{"network_offer_id": page}],
+            "paging": {"page": page, "page_size": page_size, "total_count": 20000},
+        }
+
+    adapter = mock_api(stream, handler)
+
+    list(stream.request_records(None))
+    first_run = {r.url.split("page_size=")[1] for r in adapter.requests}
+    adapter.requests.clear()
+    list(stream.request_records(None))
+
+    assert first_run == {"2000"}
+    assert "page_size=8000" in adapter.requests[0].url
+
+
+def test_timed_out_page_retried_smaller(make_tap, mock_api, monkeypatch):
+    """A page that times out is requested again at half the size in the same run."""
+    stream = make_tap(adaptive_sizing=True).streams["offers"]
+    requested = []
+
+    def no_wait():
+        while True:
+            yield 0
+
+    def handler(_path, params, _payload):
+        page = int(params.get("page", 1))
+        page_size = int(params["page_size"])
+        requested.append((page, page_size))
+
+        if (page, page_size) == (2, 2000):
+            raise requests.exceptions.ReadTimeout
+
+        start = (page - 1) * page_size
+        offers = range(start, min(start + page_size, 5000))
+        return {
+            "offers": [{"network_offer_id": i} for i in offers],
+            "paging": {"page": page, "page_size": page_size, "total_count": 5000},
+        }
+
+    monkeypatch.setattr(stream, "backoff_wait_generator", no_wait)
+    mock_api(stream, handler)
+
+    records = list(stream.request_records(None))
+
+    assert [r["network_offer_id"] for r in records] == list(range(5000))
+    assert requested == [(1, 2000), (2, 2000), (3, 1000), (4, 1000), (5, 1000)]
+
+
+def test_disabled(tap):
+    """Without adaptive sizing, sizes are fixed."""
+    stream = tap.streams["clicks"]
+    stream.window_size.observe(elapsed=1000, size=0)
+
+    assert stream.window_size.value == 14 * 24 * 60 * 60
+
+
+@pytest.mark.parametrize(
+    ("status_code", "expected"),
+    [
+        pytest.param(503, 1000, id="server-error"),
+        pytest.param(429, 2000, id="rate-limited"),
+    ],
+)
+def test_shrink_on_server_error(make_tap, status_code, expected):
+    """Server errors shrink the page size, rate limiting does not."""
+    stream = make_tap(adaptive_sizing=True).streams["offers"]
+    response = requests.Response()
+    response.status_code = status_code
+    response.request = requests.Request("GET", "https://example.com").prepare()
+
+    with pytest.raises(RetriableAPIError):
+        stream.validate_response(response)
+
+    assert stream.page_size.value == expected
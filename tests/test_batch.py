@@ -0,0 +1,90 @@
+"""Tests for BATCH message support."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
+
+import pytest
+
+from tests.conftest import NOW
+
+
+def _batch_config(tmp_path, fmt):
+    return {
+        "encoding": {"format": fmt, "compression": "gzip"},
+        "storage": {"root": f"file://{tmp_path}", "prefix": "conversions-"},
+        "batch_size": 30,
+    }
+
+
+def _read_jsonl(uri):
+    with gzip.open(urlsplit(uri).path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_conversions_batches(make_tap, mock_api, conversions_handler, capsys, tmp_path):
+    """Partitions are checkpointed as complete only after their last batch."""
+    timestamps = [int((NOW - timedelta(hours=5 * i)).timestamp()) for i in range(100)]
+    stream = make_tap(
+        start_date=(NOW - timedelta(days=25)).isoformat(),
+        conversions_partition_days=7,
+        batch_config=_batch_config(tmp_path, "jsonl"),
+    ).streams["conversions"]
+    mock_api(stream, conversions_handler(timestamps))
+
+    stream.sync()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert not [m for m in messages if m["type"] == "RECORD"]
+
+    written = []
+
+    for message in messages:
+        if message["type"] == "BATCH":
+            for uri in message["manifest"]:
+                written.extend(_read_jsonl(uri))
+
+        if message["type"] == "STATE":
+            partitions = message["value"]["bookmarks"]["conversions"]["partitions"]
+
+            for partition in partitions:
+                if not partition.get("complete"):
+                    continue
+
+                start, end = (
+                    datetime.fromisoformat(partition["context"][k]).timestamp()
+                    for k in ("from", "to")
+                )
+                expected = {ts for ts in timestamps if start <= ts <= end}
+                assert expected <= {r["conversion_unix_timestamp"] for r in written}
+
+    assert sorted(r["conversion_unix_timestamp"] for r in written) == sorted(timestamps)
+    assert all(
+        set(r) == {"conversion_id", "conversion_unix_timestamp"} for r in written
+    )
+
+
+def test_parquet_batches(make_tap, mock_api, conversions_handler, capsys, tmp_path):
+    """Batches can be written as Parquet files."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    timestamps = [int((NOW - timedelta(hours=i)).timestamp()) for i in range(50)]
+    stream = make_tap(
+        start_date=(NOW - timedelta(days=3)).isoformat(),
+        batch_config=_batch_config(tmp_path, "parquet"),
+    ).streams["conversions"]
+    mock_api(stream, conversions_handler(timestamps))
+
+    stream.sync()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    tables = [
+        pq.read_table(urlsplit(uri).path)
+        for m in messages
+        if m["type"] == "BATCH"
+        for uri in m["manifest"]
+    ]
+
+    assert sum(table.num_rows for table in tables) == len(timestamps)
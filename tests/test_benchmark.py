@@ -0,0 +1,93 @@
+"""Benchmarks of CLI startup, and of syncing each stream from a synthetic mock API.
+
+Run with `pytest -m perf`. Save a baseline with `--benchmark-autosave`, and fail
+on regressions against it with `--benchmark-compare --benchmark-compare-fail`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from datetime import timedelta
+
+import pytest
+
+from tests.conftest import NOW
+from tests.synthetic import SyntheticEverflow
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+COUNTS = {"offers": 10_000, "conversions": 20_000, "clicks": 20_000}
+
+
+@pytest.mark.parametrize("name", list(COUNTS))
+def test_sync_throughput(benchmark, make_tap, mock_server, monkeypatch, name):
+    """Sync a stream, reporting records, bytes and requests per second."""
+    totals = {"bytes": 0, "requests": 0}
+
+    def count_response(response, *_args, **_kwargs):
+        totals["bytes"] += len(response.content)
+        totals["requests"] += 1
+
+    def setup():
+        tap = make_tap(start_date=(NOW - timedelta(days=7)).isoformat())
+        stream = tap.streams[name]
+        mock_server(
+            stream,
+            SyntheticEverflow(tap, **{name: COUNTS[name]}, days=7, now=NOW),
+        )
+        tap.requests_session.hooks["response"].append(count_response)
+        return (stream,), {}
+
+    with open(os.devnull, "w") as devnull:  # noqa: PTH123
+        monkeypatch.setattr(sys, "stdout", devnull)
+        benchmark.pedantic(lambda stream: stream.sync(), setup=setup, rounds=3)
+
+        seconds = benchmark.stats.stats.total
+        records = COUNTS[name] * benchmark.stats.stats.rounds
+
+        benchmark.extra_info.update(
+            {
+                "records_per_second": records / seconds,
+                "bytes_per_second": totals["bytes"] / seconds,
+                "requests_per_record": totals["requests"] / records,
+            }
+        )
+
+        # memory is traced over a separate sync, as tracing slows it down
+        (stream,), _ = setup()
+        tracemalloc.start()
+
+        try:
+            stream.sync()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    benchmark.extra_info["peak_traced_kb"] = peak // 1024
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param(["--about"], id="about"),
+        pytest.param(["--discover"], id="discover"),
+    ],
+)
+def test_startup(benchmark, tmp_path, args):
+    """Run the tap from interpreter start to exit."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"api_key": "test"}))
+    command = [sys.executable, "-m", "tap_everflow", "--config", str(config_path)]
+
+    benchmark.pedantic(
+        subprocess.run,
+        args=([*command, *args],),
+        kwargs={"check": True, "capture_output": True},
+        rounds=5,
+    )
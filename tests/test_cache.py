@@ -0,0 +1,105 @@
+"""Tests for the reference data cache."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+import requests
+
+from tests.conftest import UTC_TIMEZONE_ID, MockEverflowAdapter
+
+TIMEZONES = {
+    "timezones": [
+        {"timezone_id": 1, "timezone": "Europe/London"},
+        {"timezone_id": UTC_TIMEZONE_ID, "timezone": "UTC"},
+    ]
+}
+
+
+@pytest.fixture
+def mount_timezones():
+    """Serve the timezone table to a tap, returning the adapter."""
+
+    def _mount_timezones(tap, timezones=TIMEZONES):
+        adapter = MockEverflowAdapter(lambda *_: timezones)
+        tap.requests_session.mount("https://", adapter)
+        return adapter
+
+    return _mount_timezones
+
+
+def test_shared_between_streams(tap, mount_timezones):
+    """The timezone table is requested once for all streams."""
+    adapter = mount_timezones(tap)
+
+    ids = {stream.utc_timezone_id for stream in tap.streams.values()}
+
+    assert ids == {UTC_TIMEZONE_ID}
+    assert len(adapter.requests) == 1
+
+
+def test_persisted_between_runs(make_tap, mount_timezones, tmp_path):
+    """The timezone table is reused from disk until it expires."""
+    path = tmp_path / "cache" / "metadata.json"
+
+    tap = make_tap(metadata_cache_path=str(path))
+    adapter = mount_timezones(tap)
+    assert tap.streams["clicks"].utc_timezone_id == UTC_TIMEZONE_ID
+    assert len(adapter.requests) == 1
+
+    tap = make_tap(metadata_cache_path=str(path))
+    adapter = mount_timezones(tap)
+    assert tap.streams["clicks"].utc_timezone_id == UTC_TIMEZONE_ID
+    assert not adapter.requests
+
+    tap = make_tap(metadata_cache_path=str(path), metadata_cache_ttl=0)
+    adapter = mount_timezones(tap)
+    assert tap.streams["clicks"].utc_timezone_id == UTC_TIMEZONE_ID
+    assert len(adapter.requests) == 1
+
+
+def test_refreshed_without_utc(make_tap, mount_timezones, tmp_path):
+    """A cached timezone table without UTC is fetched again."""
+    path = tmp_path / "metadata.json"
+    tap = make_tap(metadata_cache_path=str(path), metadata_cache_ttl=10**12)
+    url = f"{tap.streams['clicks'].url_base}/meta/timezones"
+    stale = {"timezones": TIMEZONES["timezones"][:1]}
+    path.write_text(json.dumps({url: {"fetched_at": 0, "value": stale}}))
+
+    adapter = mount_timezones(tap)
+
+    assert tap.streams["clicks"].utc_timezone_id == UTC_TIMEZONE_ID
+    assert len(adapter.requests) == 1
+    assert json.loads(path.read_text())[url]["value"] == TIMEZONES
+
+
+def test_unreadable_file(make_tap, mount_timezones, tmp_path):
+    """A corrupt cache file is ignored and replaced."""
+    path = tmp_path / "metadata.json"
+    path.write_text("{not json")
+    tap = make_tap(metadata_cache_path=str(path))
+    adapter = mount_timezones(tap)
+
+    assert tap.streams["clicks"].utc_timezone_id == UTC_TIMEZONE_ID
+    assert len(adapter.requests) == 1
+    assert json.loads(path.read_text())
+
+
+def test_rate_limited(tap):
+    """A rate limited timezone request is retried after the time the API asks for."""
+    rate_limited = requests.Response()
+    rate_limited.status_code = 429
+    rate_limited.headers["Retry-After"] = "0.2"
+    rate_limited._content = b"{}"  # noqa: SLF001
+    responses = iter([rate_limited])
+    adapter = MockEverflowAdapter(lambda *_: next(responses, TIMEZONES))
+    tap.requests_session.mount("https://", adapter)
+
+    start = time.monotonic()
+
+    assert tap.streams["clicks"].utc_timezone_id == UTC_TIMEZONE_ID
+    assert 0.2 <= time.monotonic() - start < 2
+    assert len(adapter.requests) == 2
+    assert adapter.requests[0].headers["X-Eflow-API-Key"] == "test"
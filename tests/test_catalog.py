@@ -0,0 +1,83 @@
+"""Tests for the shipped discovery catalog."""
+
+from __future__ import annotations
+
+import json
+
+from tap_everflow import streams
+from tap_everflow.catalog import CATALOG_PATH, generate
+from tap_everflow.tap import TapEverflow
+
+STREAM_CLASSES = (streams.OffersStream, streams.ConversionsStream, streams.ClicksStream)
+
+
+def _count_builds(monkeypatch) -> list[str]:
+    builds = []
+
+    for stream_class in STREAM_CLASSES:
+
+        def build_schema(self, build_schema=stream_class.build_schema):
+            builds.append(self.name)
+            return build_schema(self)
+
+        monkeypatch.setattr(stream_class, "build_schema", build_schema)
+
+    return builds
+
+
+def test_shipped_catalog_current():
+    """The shipped catalog matches the stream definitions.
+
+    Regenerate it with `python -m tap_everflow.catalog`.
+    """
+    assert json.loads(CATALOG_PATH.read_text()) == generate(TapEverflow)
+
+
+def test_discover_from_shipped_catalog(make_tap, monkeypatch):
+    """Discovery reads the shipped catalog without building any schema."""
+    builds = _count_builds(monkeypatch)
+
+    tap = make_tap()
+    catalog = tap.catalog_dict
+
+    assert [s["tap_stream_id"] for s in catalog["streams"]] == [
+        "clicks",
+        "conversions",
+        "offers",
+    ]
+    assert tap.streams["offers"].schema["properties"]["network_offer_id"]
+    assert builds == []
+
+
+def test_stale_catalog(make_tap, monkeypatch, tmp_path):
+    """A catalog generated for another tap version is ignored."""
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({**generate(TapEverflow), "version": "0.0.0"}))
+    monkeypatch.setattr(TapEverflow, "catalog_path", path)
+    builds = _count_builds(monkeypatch)
+
+    tap = make_tap()
+    catalog = json.loads(tap.catalog_json_text)
+
+    assert sorted(builds) == ["clicks", "conversions", "offers"]
+    assert {"version": tap.plugin_version, **catalog} == generate(TapEverflow)
+
+
+def test_selected_schemas_only(mock_api, offers_handler, monkeypatch, capsys):
+    """Only the schemas of selected streams are built, given a catalog."""
+    monkeypatch.setattr(TapEverflow, "catalog_path", None)
+    catalog = json.loads(CATALOG_PATH.read_text())
+
+    for entry in catalog["streams"]:
+        for metadata in entry["metadata"]:
+            if not metadata["breadcrumb"]:
+                metadata["metadata"]["selected"] = entry["tap_stream_id"] == "offers"
+
+    builds = _count_builds(monkeypatch)
+    tap = TapEverflow(config={"api_key": "test"}, catalog=catalog)
+    mock_api(tap.streams["offers"], offers_handler(total_count=10))
+
+    tap.sync_all()
+
+    assert builds == ["offers"]
+    assert capsys.readouterr().out.count('"RECORD"') == 10
@@ -0,0 +1,144 @@
+"""Tests for resuming clicks syncs from intra-window checkpoints."""
+
+from __future__ import annotations
+
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.conftest import NOW
+
+PAGE_SIZE = 10
+
+
+class Interrupted(Exception):  # noqa: N818
+    """Raised by the mock API to interrupt a sync."""
+
+
+def _interrupt_after(handler, requests):
+    def interrupting_handler(path, params, payload):
+        nonlocal requests
+
+        if not requests:
+            raise Interrupted
+
+        requests -= 1
+        return handler(path, params, payload)
+
+    return interrupting_handler
+
+
+def _make_clicks(timestamps, per_second=3):
+    start = int((NOW - timedelta(days=20)).timestamp())
+
+    return [
+        {
+            "transaction_id": f"{i * 7919 % 10007:x}",  # unordered
+            "unix_timestamp": start + i // per_second * 60,
+        }
+        for i in range(timestamps * per_second)
+    ]
+
+
+def _make_stream(make_tap, mock_api, handler, state=None):
+    stream = make_tap(
+        state=state,
+        start_date=(NOW - timedelta(days=21)).isoformat(),
+    ).streams["clicks"]
+    adapter = mock_api(stream, handler)
+    return stream, adapter
+
+
+def _read_records(capsys):
+    return [
+        json.loads(line)["record"]
+        for line in capsys.readouterr().out.splitlines()
+        if '"RECORD"' in line
+    ]
+
+
+def _keys(records):
+    return sorted((r["unix_timestamp"], r["transaction_id"]) for r in records)
+
+
+def test_resume_mid_window(make_tap, mock_api, clicks_handler, capsys):
+    """An interrupted sync resumes within its window without duplicates or gaps."""
+    clicks = _make_clicks(40)
+
+    stream, _ = _make_stream(
+        make_tap,
+        mock_api,
+        _interrupt_after(clicks_handler(clicks, page_size=PAGE_SIZE), 6),
+    )
+
+    with pytest.raises(Interrupted):
+        stream.sync()
+
+    emitted = _read_records(capsys)
+    state = copy.deepcopy(stream.tap_state)
+    clicks_state = state["bookmarks"]["clicks"]
+
+    assert 0 < len(emitted) < len(clicks)
+    assert clicks_state["position"] == len(emitted)
+    latest = max(r["unix_timestamp"] for r in emitted)
+    assert clicks_state["cursor"]["unix_timestamp"] == latest
+    assert sorted(clicks_state["cursor"]["transaction_ids"]) == sorted(
+        r["transaction_id"] for r in emitted if r["unix_timestamp"] == latest
+    )
+
+    stream, adapter = _make_stream(
+        make_tap, mock_api, clicks_handler(clicks, page_size=PAGE_SIZE), state=state
+    )
+    stream.sync()
+
+    resumed = _read_records(capsys)
+    first_request = json.loads(adapter.requests[0].body)
+
+    assert _keys(emitted + resumed) == _keys(clicks)
+    assert len(adapter.requests) < 10
+    assert (
+        datetime.strptime(first_request["to"], r"%Y-%m-%d %H:%M:%S")
+        .replace(tzinfo=timezone.utc)
+        .isoformat()
+        == clicks_state["window"]["to"]
+    )
+    assert "window" not in stream.tap_state["bookmarks"]["clicks"]
+
+
+def test_cursor_second(make_tap, mock_api, clicks_handler, capsys):
+    """Clicks in the cursor second are skipped only if already synced."""
+    timestamp = int((NOW - timedelta(days=10)).timestamp())
+    clicks = [
+        {"transaction_id": "z", "unix_timestamp": timestamp - 1},
+        {"transaction_id": "a", "unix_timestamp": timestamp},
+        {"transaction_id": "b", "unix_timestamp": timestamp},
+        {"transaction_id": "c", "unix_timestamp": timestamp},
+        {"transaction_id": "d", "unix_timestamp": timestamp + 1},
+    ]
+    state = {
+        "bookmarks": {
+            "clicks": {
+                "cursor": {
+                    "unix_timestamp": timestamp,
+                    "transaction_id": "b",
+                    "transaction_ids": ["b"],
+                },
+            },
+        },
+    }
+
+    stream, _ = _make_stream(
+        make_tap, mock_api, clicks_handler(clicks, page_size=PAGE_SIZE), state
+    )
+    stream.sync()
+
+    emitted = [r["transaction_id"] for r in _read_records(capsys)]
+
+    assert sorted(emitted) == ["a", "c", "d"]
+    assert stream.tap_state["bookmarks"]["clicks"]["cursor"] == {
+        "unix_timestamp": timestamp + 1,
+        "transaction_id": "d",
+        "transaction_ids": ["d"],
+    }
@@ -0,0 +1,149 @@
+"""Tests for the Everflow stream base class."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from datetime import datetime, timedelta
+
+import requests
+
+from tap_everflow import serialization, streams
+
+
+def _count_decodes(monkeypatch):
+    calls = []
+    loads = requests.models.complexjson.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(args)
+        return loads(*args, **kwargs)
+
+    monkeypatch.setattr(requests.models.complexjson, "loads", counting_loads)
+    monkeypatch.setattr(json, "loads", counting_loads)
+
+    if serialization.orjson:
+        orjson_loads = serialization.orjson.loads
+
+        def counting_orjson_loads(*args, **kwargs):
+            calls.append(args)
+            return orjson_loads(*args, **kwargs)
+
+        monkeypatch.setattr(serialization.orjson, "loads", counting_orjson_loads)
+
+    return calls
+
+
+def test_conversions_page_decoded_once(tap, make_response, monkeypatch):
+    """A conversions page is decoded once for records and pagination."""
+    stream = tap.streams["conversions"]
+    response = make_response(
+        stream,
+        {
+            "conversions": [
+                {"conversion_id": str(i), "conversion_unix_timestamp": i}
+                for i in range(2000)
+            ],
+            "paging": {"page": 1, "page_size": 2000, "total_count": 4000},
+        },
+    )
+    decodes = _count_decodes(monkeypatch)
+
+    paginator = stream.get_new_paginator()
+    records = list(stream.parse_response(response))
+    paginator.advance(response)
+
+    assert len(records) == 2000
+    assert paginator.current_value == 2
+    assert len(decodes) == 1
+
+
+def test_clicks_page_decoded_once(tap, make_response, monkeypatch):
+    """A clicks page is decoded once, without decoding the request body."""
+    stream = tap.streams["clicks"]
+    response = make_response(
+        stream,
+        {
+            "clicks": [
+                {"transaction_id": str(i), "unix_timestamp": 1_700_000_000 - i}
+                for i in range(2000)
+            ],
+        },
+    )
+    decodes = _count_decodes(monkeypatch)
+
+    paginator = stream.get_new_paginator()
+    records = list(stream.parse_response(response))
+    paginator.advance(response)
+
+    assert len(records) == 2000
+    assert paginator.current_value.timestamp() == 1_700_000_000
+    assert len(decodes) == 1
+
+
+def test_concurrent_pages_in_order(make_tap, mock_api, offers_handler):
+    """Pages fetched concurrently are emitted in page order."""
+    stream = make_tap(max_concurrency=4).streams["offers"]
+    handler = offers_handler(total_count=2000 * 9 + 1, delay=0.05)
+    adapter = mock_api(stream, handler)
+
+    records = list(stream.request_records(None))
+
+    assert [r["network_offer_id"] for r in records] == list(range(2000 * 9 + 1))
+    assert len(adapter.requests) == 10
+    assert 1 < handler.max_in_flight <= 4
+
+
+def test_sequential_pages(tap, mock_api, offers_handler):
+    """Without max_concurrency pages are requested one at a time."""
+    stream = tap.streams["offers"]
+    handler = offers_handler(total_count=4500)
+    adapter = mock_api(stream, handler)
+
+    records = list(stream.request_records(None))
+
+    assert len(records) == 4500
+    assert len(adapter.requests) == 3
+    assert handler.max_in_flight == 1
+
+
+def test_shared_session(make_tap):
+    """All streams share one pooled session negotiating compression."""
+    tap = make_tap(max_concurrency=6, max_parallel_streams=3)
+    sessions = {id(stream.requests_session) for stream in tap.streams.values()}
+    adapter = tap.requests_session.get_adapter("https://api.eflow.team")
+
+    assert sessions == {id(tap.requests_session)}
+    assert adapter._pool_maxsize == 18  # noqa: SLF001
+    assert "gzip" in tap.requests_session.headers["Accept-Encoding"]
+
+
+def test_concurrent_pages_same_range(make_tap, mock_api, monkeypatch):
+    """Every page of a run is requested over the same date range."""
+    stream = make_tap(max_concurrency=4).streams["conversions"]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+    clock = itertools.count()
+
+    class TickingDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None) -> TickingDatetime:
+            return super().now(tz=tz) + timedelta(seconds=next(clock))
+
+    monkeypatch.setattr(streams, "datetime", TickingDatetime)
+
+    def handler(_path, params, _payload):
+        return {
+            "conversions": [],
+            "paging": {
+                "page": int(params.get("page", 1)),
+                "page_size": 50,
+                "total_count": 500,
+            },
+        }
+
+    adapter = mock_api(stream, handler)
+
+    list(stream.request_records(None))
+
+    assert len(adapter.requests) == 10
+    assert len({json.loads(r.body)["to"] for r in adapter.requests}) == 1
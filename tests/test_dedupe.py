@@ -0,0 +1,41 @@
+"""Tests for dropping duplicate records."""
+
+from __future__ import annotations
+
+from tap_everflow.dedupe import SeenIndex
+
+
+def test_seen_index():
+    """Duplicates are counted, and the least recently seen keys are forgotten."""
+    index = SeenIndex(max_size=3)
+
+    assert [index.add(k) for k in (1, 2, 3, 1, 4)] == [True] * 3 + [False, True]
+    assert index.dropped == 1
+    assert len(index) == 3
+
+    # 2 was least recently seen when 4 was added
+    assert index.add(2)
+    assert not index.add(1)
+    assert index.dropped == 2
+
+
+def test_duplicates_dropped(tap, mock_api, offers_handler):
+    """Records repeated across pages are emitted once."""
+    stream = tap.streams["offers"]
+    mock_api(stream, offers_handler(pages=[[0, 1], [1, 2], [2, 3]]))
+
+    records = list(stream.get_records(None))
+
+    assert [r["network_offer_id"] for r in records] == [0, 1, 2, 3]
+    assert stream.seen_index.dropped == 2
+
+
+def test_disabled(make_tap, mock_api, offers_handler):
+    """Duplicates are emitted with a zero size index."""
+    stream = make_tap(dedupe_index_size=0).streams["offers"]
+    mock_api(stream, offers_handler(pages=[[0, 1], [1, 2]]))
+
+    records = list(stream.get_records(None))
+
+    assert [r["network_offer_id"] for r in records] == [0, 1, 1, 2]
+    assert stream.seen_index is None
@@ -0,0 +1,100 @@
+"""Tests for incremental JSON parsing."""
+
+from __future__ import annotations
+
+import io
+import json
+from decimal import Decimal
+
+import pytest
+import requests
+
+from tap_everflow import jsonstream
+
+BODY = {
+    "conversions": [
+        {"conversion_id": f"id-{i}", "payout": 1.25, "sub1": "café ✓"}
+        for i in range(50)
+    ],
+    "paging": {"page": 2, "page_size": 50, "total_count": 1234567},
+}
+
+
+def _chunks(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1_000_000])
+def test_iter_records(chunk_size):
+    """Records and the surrounding object survive any chunk boundary."""
+    data = json.dumps(BODY, ensure_ascii=False).encode()
+    envelope = {}
+
+    records = list(
+        jsonstream.iter_records(_chunks(data, chunk_size), "conversions", envelope)
+    )
+
+    assert records == json.loads(data, parse_float=Decimal)["conversions"]
+    assert envelope == {
+        "conversions": records[:1],
+        "paging": {"page": 2, "page_size": 50, "total_count": 1234567},
+    }
+
+
+def test_iter_records_empty():
+    """An empty records array yields nothing."""
+    envelope = {}
+
+    records = list(
+        jsonstream.iter_records([b'{"clicks": [ ], "n": 1}'], "clicks", envelope)
+    )
+
+    assert records == []
+    assert envelope == {"clicks": [], "n": 1}
+
+
+def test_iter_records_invalid():
+    """Malformed bodies raise a decode error."""
+    with pytest.raises(json.JSONDecodeError):
+        list(jsonstream.iter_records([b'{"clicks": [{"a": 1}'], "clicks", {}))
+
+
+def test_stream_responses(make_tap, make_response):
+    """Streamed responses feed the same records and paging to the paginator."""
+    stream = make_tap(stream_responses=True).streams["conversions"]
+    response = make_response(stream, BODY)
+
+    paginator = stream.get_new_paginator()
+    records = list(stream.parse_response(response))
+    paginator.advance(response)
+
+    assert len(records) == 50
+    assert stream.requests_session.stream
+    assert paginator.current_value == 3
+
+
+def test_stream_responses_interrupted(make_tap, make_response, mock_api):
+    """Interrupted streamed bodies are requested again without repeating records."""
+    stream = make_tap(stream_responses=True).streams["conversions"]
+    response = make_response(stream, BODY)
+    content = response.content
+
+    class InterruptedBody(io.BytesIO):
+        def read(self, size=-1):
+            remaining = len(content) // 2 - self.tell()
+
+            if not remaining:
+                raise requests.exceptions.ChunkedEncodingError
+
+            return super().read(min(size, remaining))
+
+    response._content = False  # noqa: SLF001
+    response._content_consumed = False  # noqa: SLF001
+    response.raw = InterruptedBody(content)
+    adapter = mock_api(stream, lambda *_: BODY)
+
+    records = list(stream.parse_response(response))
+
+    assert records == BODY["conversions"]
+    assert stream.parse_json(response)["paging"] == BODY["paging"]
+    assert len(adapter.requests) == 1
@@ -0,0 +1,86 @@
+"""Tests for clicks pagination over dense seconds."""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+import pytest
+
+from tests.conftest import NOW
+
+PAGE_SIZE = 100
+
+
+def _make_bursts(*sizes):
+    start = int((NOW - timedelta(days=2)).timestamp())
+    clicks = []
+
+    for i, size in enumerate(sizes):
+        timestamp = start + i * 10
+        clicks.extend(
+            {"transaction_id": f"{timestamp}-{j}", "unix_timestamp": timestamp}
+            for j in range(size)
+        )
+
+    return clicks
+
+
+def _sync(make_tap, mock_api, handler, **config):
+    stream = make_tap(
+        start_date=(NOW - timedelta(days=3)).isoformat(), **config
+    ).streams["clicks"]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+    adapter = mock_api(stream, handler)
+
+    records = list(stream.request_records(None))
+    requests = [
+        (*json.loads(r.body).values(), urlsplit(r.url).query) for r in adapter.requests
+    ]
+
+    return records, requests
+
+
+def test_bursts(make_tap, mock_api, clicks_handler):
+    """Bursts of clicks in one second are synced in full, without repeat requests."""
+    sizes = [1, 60, 3, 99, PAGE_SIZE, 40, 1, PAGE_SIZE, PAGE_SIZE, 7] * 5
+    clicks = _make_bursts(*sizes)
+
+    records, requests = _sync(
+        make_tap, mock_api, clicks_handler(clicks, page_size=PAGE_SIZE)
+    )
+
+    assert sorted(r["transaction_id"] for r in records) == sorted(
+        c["transaction_id"] for c in clicks
+    )
+    assert len(requests) == len(set(requests))
+
+    # a second filling a page may hold more, so it is requested again by offset
+    assert len(requests) <= len(sizes) + 1 + 2 * sizes.count(PAGE_SIZE)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param({}, id="windows"),
+        pytest.param(
+            {"clicks_shard_interval": "hour", "max_concurrency": 4}, id="shards"
+        ),
+    ],
+)
+def test_burst_over_page(make_tap, mock_api, clicks_handler, caplog, config):
+    """A second with more clicks than a page is requested in pages by offset."""
+    clicks = _make_bursts(PAGE_SIZE, 5, PAGE_SIZE * 20 + 10, 5)
+
+    with caplog.at_level(logging.INFO):
+        records, requests = _sync(
+            make_tap, mock_api, clicks_handler(clicks, page_size=PAGE_SIZE), **config
+        )
+
+    assert sorted(r["transaction_id"] for r in records) == sorted(
+        c["transaction_id"] for c in clicks
+    )
+    assert len(requests) == len(set(requests))
+    assert "filled a page, requesting that second in pages" in caplog.text
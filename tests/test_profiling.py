@@ -0,0 +1,61 @@
+"""Tests for the sampling profiler."""
+
+from __future__ import annotations
+
+import threading
+
+from tap_everflow.profiling import PHASES, StackSampler
+
+
+def test_profile(make_tap, mock_api, offers_handler, tmp_path):
+    """A stream sync writes samples labelled by phase."""
+    stream = make_tap(profile_dir=str(tmp_path)).streams["offers"]
+    handler = offers_handler(total_count=2000 * 3, delay=0.05)
+    mock_api(stream, handler)
+
+    stream.sync()
+
+    [path] = tmp_path.glob("offers-*.collapsed")
+    samples = {}
+
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        samples[stack] = int(count)
+
+    phases = {stack.split(";", 1)[0] for stack in samples}
+
+    assert "request" in phases
+    assert phases <= {*PHASES.values(), "sync"}
+    assert all(stack.split(";")[1] == "tap_everflow.client.sync" for stack in samples)
+    assert any("singer_sdk.streams.rest._request" in stack for stack in samples)
+
+
+def test_worker_threads():
+    """Worker threads named after the stream are sampled too."""
+    sampler = StackSampler("offers")
+    stop = threading.Event()
+
+    def offers_worker():
+        stop.wait()
+
+    def clicks_worker():
+        stop.wait()
+
+    threads = [
+        threading.Thread(target=offers_worker, name="offers_0"),
+        threading.Thread(target=clicks_worker, name="clicks_0"),
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    with sampler:
+        sampler.sample()
+
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    assert any("offers_worker;threading.wait" in stack for stack in sampler.samples)
+    assert not any("clicks_worker" in stack for stack in sampler.samples)
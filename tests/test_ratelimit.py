@@ -0,0 +1,80 @@
+"""Tests for client-side rate limiting."""
+
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from tap_everflow.ratelimit import RateLimiter, get_retry_after
+
+
+def test_token_bucket():
+    """Requests beyond the burst wait for tokens to refill."""
+    limiter = RateLimiter(rate=10, burst=2)
+
+    delays = [limiter.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0, 0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_unlimited_pause():
+    """Without a rate every request is sent at once, unless paused."""
+    limiter = RateLimiter()
+
+    assert [limiter.reserve() for _ in range(100)] == [0] * 100
+
+    limiter.pause(5)
+
+    assert limiter.reserve() == pytest.approx(5, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        (lambda _: {"Retry-After": "7"}, 7),
+        (lambda now: {"Retry-After": formatdate(now + 30, usegmt=True)}, 30),
+        (lambda _: {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "12"}, 12),
+        (
+            lambda now: {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": now + 9},
+            9,
+        ),
+        (lambda _: {"X-RateLimit-Remaining": "5", "X-RateLimit-Reset": "12"}, None),
+        (lambda _: {}, None),
+    ],
+)
+def test_get_retry_after(status_response, headers, expected):
+    """Wait times are read from seconds, dates and timestamps."""
+    headers = {k: str(v) for k, v in headers(time.time()).items()}
+    retry_after = get_retry_after(status_response(**headers))
+
+    if expected is None:
+        assert retry_after is None
+    else:
+        assert retry_after == pytest.approx(expected, abs=1)
+
+
+def test_retry_after_backoff(make_tap, mock_api, offers_handler, status_response):
+    """A rate limited request is retried after the time the API asks for."""
+    stream = make_tap(max_concurrency=3).streams["offers"]
+    offers = offers_handler(total_count=2000 * 4)
+    rate_limited = []
+
+    def handler(path, params, payload):
+        if params.get("page") == "3" and not rate_limited:
+            rate_limited.append(time.monotonic())
+            return status_response(429, **{"Retry-After": "0.2"})
+
+        return offers(path, params, payload)
+
+    mock_api(stream, handler)
+
+    start = time.monotonic()
+    records = list(stream.request_records(None))
+
+    assert len(records) == 2000 * 4
+    assert rate_limited
+    assert 0.2 <= time.monotonic() - start < 2
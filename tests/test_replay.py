@@ -0,0 +1,32 @@
+"""Tests replaying cassettes of API traffic for each stream."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("name", "count"),
+    [
+        pytest.param("offers", 5, id="offers"),
+        pytest.param("conversions", 30, id="conversions"),
+        pytest.param("clicks", 40, id="clicks"),
+    ],
+)
+def test_replay(replay, capsys, name, count):
+    """Each stream syncs every record from its cassette."""
+    tap, adapter = replay(name)
+    stream = tap.streams[name]
+
+    stream.sync()
+
+    records = [
+        json.loads(line)["record"]
+        for line in capsys.readouterr().out.splitlines()
+        if '"RECORD"' in line
+    ]
+
+    assert len(records) == count
+    assert len(adapter.requests) == len(adapter.cassette.interactions)
@@ -0,0 +1,86 @@
+"""Tests for JSON encoding and decoding."""
+
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import json
+import timeit
+
+import pytest
+from singer_sdk.singerlib import RecordMessage
+from singer_sdk.singerlib.json import serialize_json
+
+from tap_everflow import serialization
+from tests.synthetic import fake_page
+
+TIME_EXTRACTED = dt.datetime(2024, 1, 1, 12, 30, 15, 123, tzinfo=dt.timezone.utc)
+
+
+def _message(record):
+    return RecordMessage(
+        stream="clicks",
+        record=record,
+        time_extracted=TIME_EXTRACTED,
+    ).to_dict()
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        {"transaction_id": "a", "payout": 1.25, "nested": {"list": [1, "é", None]}},
+        {"transaction_id": "b", "payout": float("nan")},
+        {"transaction_id": "c", "payout": decimal.Decimal("0.10")},
+        {"transaction_id": "d", "date": dt.date(2024, 1, 2)},
+        {"transaction_id": "e", "id": 2**70},
+    ],
+)
+def test_same_meaning_as_sdk(record):
+    """Messages decode to the same values as with the SDK encoding."""
+    message = _message(record)
+    encoded = serialization.dumps(message)
+
+    assert "\n" not in encoded
+    assert json.loads(encoded, parse_float=decimal.Decimal) == json.loads(
+        serialize_json(message), parse_float=decimal.Decimal
+    )
+
+
+def test_fallback(monkeypatch):
+    """Without orjson the SDK encoding and stdlib decoding are used."""
+    monkeypatch.setattr(serialization, "orjson", None)
+    message = _message({"payout": decimal.Decimal("0.10")})
+
+    assert serialization.dumps(message) == serialize_json(message)
+    assert serialization.loads(b'{"payout": 0.10}') == {
+        "payout": decimal.Decimal("0.10")
+    }
+
+
+@pytest.mark.perf
+def test_benchmark(tap):
+    """With orjson a page of clicks is encoded and decoded faster."""
+    pytest.importorskip("orjson")
+    page = serialize_json({"clicks": fake_page(tap.streams["clicks"].schema)})
+    page = page.encode()
+    messages = [_message(r) for r in serialization.loads(page)["clicks"]]
+
+    def time(func):
+        return min(timeit.repeat(func, number=1, repeat=3))
+
+    results = {
+        "encode": (
+            time(lambda: [serialization.dumps(m) for m in messages]),
+            time(lambda: [serialize_json(m) for m in messages]),
+        ),
+        "decode": (
+            time(lambda: serialization.loads(page)),
+            time(lambda: json.loads(page, parse_float=decimal.Decimal)),
+        ),
+    }
+
+    for name, (fast, stdlib) in results.items():
+        assert fast < stdlib, (
+            f"{name} {len(messages)} clicks: {fast * 1000:.1f}ms orjson, "
+            f"{stdlib * 1000:.1f}ms stdlib"
+        )
@@ -0,0 +1,191 @@
+"""Tests for stream-specific request behaviour."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from tests.conftest import NOW
+
+
+def test_clicks_shards(make_tap, mock_api, clicks_handler):
+    """Sharded clicks are emitted in window order."""
+    stream = make_tap(
+        start_date=(NOW - timedelta(days=3)).isoformat(),
+        clicks_shard_interval="hour",
+        max_concurrency=8,
+    ).streams["clicks"]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+    timestamps = [
+        int((NOW - timedelta(minutes=17 * i)).timestamp()) for i in range(1, 250)
+    ]
+    adapter = mock_api(stream, clicks_handler(timestamps))
+
+    records = list(stream.request_records(None))
+    emitted = [r["unix_timestamp"] for r in records]
+
+    hours = [ts // 3600 for ts in emitted]
+    assert hours == sorted(hours)
+    assert sorted(emitted) == sorted(timestamps)
+    assert len(adapter.requests) >= 72
+
+
+def test_clicks_shards_read_ahead(make_tap, mock_api, clicks_handler):
+    """Windows ahead of the one being emitted request only a few pages."""
+    stream = make_tap(
+        start_date=(NOW - timedelta(days=6)).isoformat(),
+        clicks_shard_interval="day",
+        max_concurrency=3,
+    ).streams["clicks"]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+    timestamps = [
+        int((NOW - timedelta(minutes=20 * i)).timestamp()) for i in range(400)
+    ]
+    adapter = mock_api(stream, clicks_handler(timestamps, page_size=10))
+    records = stream.request_records(None)
+    next(records)
+
+    assert len(adapter.requests) <= 3 * (stream.window_read_ahead + 1)
+
+    emitted = [r["unix_timestamp"] for r in records]
+
+    assert len(emitted) + 1 == len(timestamps)
+
+
+def test_conversions_partitions(make_tap, mock_api, conversions_handler, capsys):
+    """Closed conversion windows are checkpointed and skipped on the next run."""
+    config = {
+        "start_date": (NOW - timedelta(days=25)).isoformat(),
+        "conversions_partition_days": 7,
+    }
+    timestamps = [int((NOW - timedelta(hours=5 * i)).timestamp()) for i in range(100)]
+
+    stream = make_tap(**config).streams["conversions"]
+    adapter = mock_api(stream, conversions_handler(timestamps))
+    partitions = stream.partitions
+
+    assert 4 <= len(partitions) <= 5
+    assert all(p["from"] < p["to"] for p in partitions)
+
+    stream.sync()
+    state = stream.tap_state
+
+    emitted = [
+        line for line in capsys.readouterr().out.splitlines() if '"RECORD"' in line
+    ]
+    assert len(emitted) == 100
+    assert len(adapter.requests) == len(partitions)
+
+    # closed windows are collapsed into the watermark
+    conversions_state = state["bookmarks"]["conversions"]
+    assert conversions_state["watermark"] == partitions[-1]["from"]
+    assert [p["context"] for p in conversions_state["partitions"]] == partitions[-1:]
+
+    stream = make_tap(state=state, **config).streams["conversions"]
+    adapter = mock_api(stream, conversions_handler(timestamps))
+
+    assert stream.partitions == partitions[-1:]
+
+    stream.sync()
+
+    assert len(adapter.requests) == 1
+    assert stream.tap_state["bookmarks"]["conversions"] == conversions_state
+
+
+def test_conversions_partitions_interrupted(
+    make_tap, mock_api, conversions_handler, capsys
+):
+    """Windows completed before a failed run are not requested again."""
+    config = {
+        "start_date": (NOW - timedelta(days=25)).isoformat(),
+        "conversions_partition_days": 7,
+    }
+    timestamps = [int((NOW - timedelta(hours=5 * i)).timestamp()) for i in range(100)]
+    handle_conversions = conversions_handler(timestamps)
+
+    stream = make_tap(**config).streams["conversions"]
+    partitions = stream.partitions
+    failing = partitions[2]["from"][:10]
+
+    def handler(path, params, payload):
+        if payload["from"].startswith(failing):
+            msg = "Connection lost"
+            raise RuntimeError(msg)
+
+        return handle_conversions(path, params, payload)
+
+    mock_api(stream, handler)
+
+    with pytest.raises(RuntimeError):
+        stream.sync()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    state = next(m for m in reversed(messages) if m["type"] == "STATE")["value"]
+
+    stream = make_tap(state=state, **config).streams["conversions"]
+    adapter = mock_api(stream, handle_conversions)
+    stream.sync()
+
+    requested = [json.loads(r.body)["from"][:10] for r in adapter.requests]
+    contexts = [
+        p["context"] for p in stream.tap_state["bookmarks"]["conversions"]["partitions"]
+    ]
+
+    assert requested == [p["from"][:10] for p in partitions[2:]]
+    assert len(contexts) == len({json.dumps(c) for c in contexts})
+
+
+def test_offers_change_detection(make_tap, mock_api, capsys):
+    """Only new or changed offers are emitted after the first run."""
+    offers = [{"network_offer_id": i, "time_saved": 1} for i in range(5)]
+
+    def handler(_path, _params, _payload):
+        return {
+            "offers": offers,
+            "paging": {"page": 1, "page_size": 2000, "total_count": len(offers)},
+        }
+
+    def sync(state=None):
+        stream = make_tap(state=state, offers_change_detection=True).streams["offers"]
+        mock_api(stream, handler)
+        stream.sync()
+        messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        records = [m["record"] for m in messages if m["type"] == "RECORD"]
+        state = next(m for m in reversed(messages) if m["type"] == "STATE")["value"]
+        return [r["network_offer_id"] for r in records], state
+
+    emitted, state = sync()
+    assert emitted == [0, 1, 2, 3, 4]
+
+    offers[2] = {"network_offer_id": 2, "time_saved": 2}
+    offers.append({"network_offer_id": 5, "time_saved": 1})
+    del offers[0]
+
+    emitted, state = sync(state)
+    assert emitted == [2, 5]
+    assert sorted(state["bookmarks"]["offers"]["fingerprints"]) == list("12345")
+
+    emitted, _ = sync(state)
+    assert emitted == []
+
+
+def test_offers_change_detection_activate_version(make_tap, mock_api, capsys):
+    """A new table version is not activated when only changed offers are emitted."""
+    stream = make_tap(
+        offers_change_detection=True, emit_activate_version_messages=True
+    ).streams["offers"]
+    mock_api(
+        stream,
+        lambda *_: {
+            "offers": [{"network_offer_id": 1}],
+            "paging": {"page": 1, "page_size": 2000, "total_count": 1},
+        },
+    )
+    stream.sync()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert [m for m in messages if m["type"] == "RECORD"]
+    assert not [m for m in messages if m["type"] == "ACTIVATE_VERSION"]
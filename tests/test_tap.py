@@ -0,0 +1,62 @@
+"""Tests for the Everflow tap class."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import timedelta
+
+from tests.conftest import NOW
+
+
+def test_parallel_streams(  # noqa: PLR0913, PLR0917
+    make_tap, mock_api, offers_handler, clicks_handler, conversions_handler, capsys
+):
+    """Streams sync in parallel through one serialized writer."""
+    tap = make_tap(
+        start_date=(NOW - timedelta(days=2)).isoformat(),
+        max_parallel_streams=3,
+    )
+    timestamps = [int((NOW - timedelta(hours=i)).timestamp()) for i in range(1, 40)]
+    handlers = {
+        "offers": offers_handler(total_count=10),
+        "conversions": conversions_handler(timestamps),
+        "clicks": clicks_handler(timestamps),
+    }
+    in_flight: set[str] = set()
+    overlapped = threading.Event()
+
+    def handler(path, params, payload):
+        name = next(name for name in handlers if name in path)
+        in_flight.add(name)
+        time.sleep(0.1)
+
+        if len(in_flight) > 1:
+            overlapped.set()
+
+        in_flight.discard(name)
+        return handlers[name](path, params, payload)
+
+    for stream in tap.streams.values():
+        mock_api(stream, handler)
+
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    records = {
+        name: [
+            m["record"]
+            for m in messages
+            if m["type"] == "RECORD" and m["stream"] == name
+        ]
+        for name in handlers
+    }
+    state = next(m for m in reversed(messages) if m["type"] == "STATE")["value"]
+
+    assert overlapped.is_set()
+    assert len(records["offers"]) == 10
+    assert len(records["conversions"]) == len(timestamps)
+    assert sorted(r["unix_timestamp"] for r in records["clicks"]) == sorted(timestamps)
+    assert state["bookmarks"]["clicks"]["replication_key_value"] == max(timestamps)
+    assert state["bookmarks"]["conversions"]["replication_key_value"] == max(timestamps)
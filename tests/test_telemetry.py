@@ -0,0 +1,105 @@
+"""Tests for performance metrics."""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+import pytest
+
+from tests.conftest import NOW
+from tests.synthetic import SyntheticEverflow
+
+
+def _get_points(caplog) -> dict[str, list[dict]]:
+    points = defaultdict(list)
+
+    for record in caplog.records:
+        if point := record.__dict__.get("point"):
+            points[point["metric"]].append(point)
+
+    return points
+
+
+def test_sync_metrics(make_tap, mock_api, offers_handler, status_response, caplog):
+    """A sync logs request, decoding, page and output metrics."""
+    stream = make_tap().streams["offers"]
+    offers = offers_handler(total_count=2000 * 2 + 1)
+    rate_limited = []
+
+    def handler(path, params, payload):
+        if not rate_limited:
+            rate_limited.append(True)
+            return status_response(429, **{"Retry-After": "0"})
+
+        return offers(path, params, payload)
+
+    mock_api(stream, handler)
+
+    with caplog.at_level(logging.INFO):
+        stream.sync()
+
+    points = _get_points(caplog)
+
+    assert len(points["http_request_duration"]) == 4
+    assert len(points["http_response_bytes"]) == 3
+    assert len(points["decode_duration"]) == 3
+    assert [p["value"] for p in points["page_record_count"]] == [2000, 2000, 1]
+    assert len(points["http_retry_count"]) == 1
+    assert len(points["output_blocked_duration"]) == 1
+    assert points["output_blocked_duration"][0]["type"] == "timer"
+    assert points["decode_duration"][0]["tags"] == {
+        "stream": "offers",
+        "endpoint": "/networks/offers",
+    }
+
+
+def test_window_metrics(make_tap, mock_api, caplog):
+    """The date range of each clicks request is logged."""
+    stream = make_tap(start_date=(NOW - timedelta(days=20)).isoformat()).streams[
+        "clicks"
+    ]
+    stream._write_starting_replication_value(None)  # noqa: SLF001
+    mock_api(stream, lambda *_: {"clicks": []})
+
+    with caplog.at_level(logging.INFO):
+        list(stream.request_records(None))
+
+    points = _get_points(caplog)
+
+    first, last = (p["value"] for p in points["window_seconds"])
+
+    assert first == timedelta(days=14).total_seconds()
+    assert last == pytest.approx(timedelta(days=6).total_seconds(), abs=60)
+
+
+def test_metrics_textfile(make_tap, mock_api, tmp_path):
+    """A summary of the metrics is written at the end of the run."""
+    path = tmp_path / "tap_everflow.prom"
+    tap = make_tap(
+        metrics_textfile_path=str(path),
+        start_date=(NOW - timedelta(days=1)).isoformat(),
+    )
+    mock_api(
+        tap.streams["offers"],
+        SyntheticEverflow(tap, offers=5, conversions=10, clicks=10, days=1, now=NOW),
+    )
+
+    tap.sync_all()
+
+    lines = path.read_text().splitlines()
+
+    assert "# TYPE tap_everflow_page_record_count summary" in lines
+    assert (
+        "tap_everflow_page_record_count_sum"
+        '{stream="offers",endpoint="/networks/offers"} 5'
+    ) in lines
+    assert any(
+        line.startswith(
+            "tap_everflow_output_blocked_duration_sum"
+            '{stream="clicks",endpoint="/networks/reporting/clicks/stream"} '
+        )
+        for line in lines
+    )
+    assert not list(tmp_path.glob(".*"))
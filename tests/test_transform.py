@@ -0,0 +1,125 @@
+"""Tests for compiled record transformers."""
+
+from __future__ import annotations
+
+import copy
+import decimal
+import logging
+import timeit
+
+import pytest
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import TypeConformanceLevel, conform_record_data_types
+
+from tap_everflow.transform import compile_transformer
+from tests.synthetic import fake_page
+
+PAGE_SIZE = 2000
+
+
+def _sdk_transform(stream, record):
+    pop_deselected_record_properties(record, stream.schema, stream.mask)
+    return conform_record_data_types(
+        stream_name=stream.name,
+        record=record,
+        schema=stream.schema,
+        level=stream.TYPE_CONFORMANCE_LEVEL,
+        logger=logging.getLogger(__name__),
+    )
+
+
+@pytest.fixture(params=["offers", "conversions", "clicks"])
+def stream(request, tap):
+    """Stream with its first and a nested property deselected."""
+    stream = tap.streams[request.param]
+    properties = stream.schema["properties"]
+    deselected = [("properties", next(iter(properties)))]
+
+    if "relationship" in properties:
+        nested = next(iter(properties["relationship"]["properties"]))
+        deselected.append(("properties", "relationship", "properties", nested))
+
+    for breadcrumb in deselected:
+        stream.mask[breadcrumb] = False
+
+    return stream
+
+
+@pytest.mark.parametrize("level", list(TypeConformanceLevel))
+def test_equivalent_to_sdk(stream, level):
+    """Compiled transformers match SDK pruning and conformance."""
+    stream.TYPE_CONFORMANCE_LEVEL = level
+    transform = compile_transformer(stream.schema, mask=stream.mask, level=level)
+    records = fake_page(stream.schema)[:50]
+    records[1]["unknown"] = decimal.Decimal("NaN")
+
+    for record in records:
+        unmapped = []
+        expected = _sdk_transform(stream, copy.deepcopy(record))
+
+        assert transform(record, unmapped) == expected
+
+        if level != TypeConformanceLevel.NONE:
+            assert "unknown" in unmapped
+
+
+def test_empty_dates(tap):
+    """Empty dates are conformed to null."""
+    stream = tap.streams["offers"]
+
+    record = stream.record_transformer({"date_live_until": ""}, [])
+
+    assert record == {"date_live_until": None}
+
+
+@pytest.mark.perf
+def test_benchmark(stream):
+    """Compiled transformers are faster than the SDK on a page of records."""
+    records = fake_page(stream.schema)
+    transform = compile_transformer(stream.schema, mask=stream.mask)
+    pages = [copy.deepcopy(records) for _ in range(3)]
+
+    compiled = min(
+        timeit.repeat(lambda: [transform(r, []) for r in records], number=1, repeat=3)
+    )
+    sdk = min(
+        timeit.repeat(
+            lambda: [_sdk_transform(stream, r) for r in pages.pop()],
+            number=1,
+            repeat=3,
+        )
+    )
+
+    assert compiled < sdk, (
+        f"{stream.name}: {PAGE_SIZE} records in {compiled * 1000:.1f}ms compiled, "
+        f"{sdk * 1000:.1f}ms SDK"
+    )
+
+
+def test_pruned_when_parsed(tap, make_response):
+    """Deselected properties are removed from records as they are parsed."""
+    stream = tap.streams["clicks"]
+    stream.mask["properties", "relationship"] = False
+    stream.mask["properties", "sub1"] = False
+    response = make_response(
+        stream,
+        {
+            "clicks": [
+                {
+                    "transaction_id": "a",
+                    "unix_timestamp": 1,
+                    "sub1": "x",
+                    "relationship": {"geolocation": {"country_code": "GB"}},
+                }
+            ]
+        },
+    )
+
+    assert list(stream.parse_response(response)) == [
+        {"transaction_id": "a", "unix_timestamp": 1}
+    ]
+
+
+def test_nothing_pruned_when_all_selected(tap):
+    """No pruning is done when every property is selected."""
+    assert tap.streams["offers"].record_pruner is None
@@ -0,0 +1,75 @@
+"""Tests for the Singer message writer."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from singer_sdk.singerlib import RecordMessage, StateMessage
+
+from tap_everflow.writer import SerializedSingerWriter
+
+
+@pytest.fixture
+def writer():
+    """Writer buffering up to 1000 characters."""
+    writer = SerializedSingerWriter()
+    writer.buffer_size = 1000
+    writer.flush_interval = 60
+    return writer
+
+
+def _record(i):
+    return RecordMessage(stream="offers", record={"network_offer_id": i})
+
+
+def test_flush_on_state(writer, capsys):
+    """Buffered messages are written with the next STATE message."""
+    for i in range(3):
+        writer.write_message(_record(i))
+
+    assert capsys.readouterr().out == ""
+
+    writer.write_message(StateMessage(value={"bookmarks": {}}))
+    lines = capsys.readouterr().out.splitlines()
+
+    assert [json.loads(line)["type"] for line in lines] == ["RECORD"] * 3 + ["STATE"]
+
+
+def test_flush_when_full(writer, capsys):
+    """Messages are written once the buffer is full."""
+    for i in range(25):
+        writer.write_message(_record(i))
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert 0 < len(lines) < 25
+    assert sum(len(line) + 1 for line in lines) >= 1000
+
+    writer.flush()
+
+    assert len(lines) + len(capsys.readouterr().out.splitlines()) == 25
+
+
+def test_flush_after_interval(writer, capsys):
+    """Messages are written once the flush interval has passed."""
+    writer.flush_interval = 0
+
+    writer.write_message(_record(0))
+
+    assert capsys.readouterr().out
+
+
+def test_buffered_sync(make_tap, mock_api, offers_handler, capsys):
+    """A buffered sync writes every message by the time it finishes."""
+    tap = make_tap(output_buffer_size=64 * 1024)
+    for name in ("conversions", "clicks"):
+        tap.streams[name].selected = False
+    mock_api(tap.streams["offers"], offers_handler(total_count=4500))
+
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert [m["type"] for m in messages if m["type"] != "RECORD"][-1] == "STATE"
+    assert len([m for m in messages if m["type"] == "RECORD"]) == 4500